@@ -1,6 +1,5 @@
 from aqt import mw, gui_hooks
 from aqt.qt import QAction, Qt
-from .timer_dialog import StudyTimerDock
 
 _dock = None
 
@@ -8,6 +7,8 @@ def toggle_timer():
     global _dock
     
     if _dock is None:
+        from .timer_dialog import StudyTimerDock
+
         _dock = StudyTimerDock(mw)
         mw.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, _dock)
     
@@ -17,13 +18,64 @@ def toggle_timer():
         _dock.show()
 
 def startup_check():
-    config = mw.addonManager.getConfig(__name__)
-    
-    if config and config.get('dock_visible', False):
+    if _dock is None:
+        config = mw.addonManager.getConfig(__name__)
+
+        if config and config.get('dock_visible', False):
+            toggle_timer()
+
+    offer_resume()
+
+def offer_resume():
+    from aqt.utils import askUser
+    from .snapshot import load_snapshot, clear_snapshot
+    from .state import STOPPED
+
+    data = load_snapshot()
+    if data is None:
+        return
+    if _dock is not None and _dock.engine.state != STOPPED:
+        return
+
+    if not askUser("Um timer de estudo foi interrompido. Deseja retomá-lo de onde parou?"):
+        clear_snapshot()
+        return
+
+    if _dock is None or not _dock.isVisible():
         toggle_timer()
+    _dock.restore_snapshot(data)
+
+def show_metrics():
+    import json
+    from aqt.utils import showText
+    from .metrics import metrics
+
+    showText(json.dumps(metrics.snapshot(), indent=2), title="Métricas do Timer de Estudo", copyBtn=True)
+
+def show_stats():
+    from .stats_dialog import StatsDialog
+
+    StatsDialog(mw).show()
+
+def show_export():
+    from .export_dialog import ExportDialog
+
+    ExportDialog(mw).show()
 
 action = QAction("Timer de Estudo", mw)
 action.triggered.connect(toggle_timer)
 mw.form.menuTools.addAction(action)
 
+stats_action = QAction("Estatísticas do Timer", mw)
+stats_action.triggered.connect(show_stats)
+mw.form.menuTools.addAction(stats_action)
+
+export_action = QAction("Exportar histórico do Timer", mw)
+export_action.triggered.connect(show_export)
+mw.form.menuTools.addAction(export_action)
+
+metrics_action = QAction("Timer de Estudo: Métricas (JSON)", mw)
+metrics_action.triggered.connect(show_metrics)
+mw.form.menuTools.addAction(metrics_action)
+
 gui_hooks.profile_did_open.append(startup_check)
\ No newline at end of file
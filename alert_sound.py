@@ -0,0 +1,62 @@
+import os
+from aqt.qt import QObject, QUrl, QApplication
+
+try:
+    from aqt.qt import QSoundEffect
+except ImportError:
+    try:
+        from PyQt6.QtMultimedia import QSoundEffect
+    except ImportError:
+        QSoundEffect = None
+
+BUNDLED_SOUND = os.path.join(os.path.dirname(__file__), "sounds", "alert.wav")
+DEFAULT_VOLUME = 0.8
+
+class AlertSound(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._effects = {}
+        self._path = None
+        self._volume = DEFAULT_VOLUME
+
+    def _resolve(self, path):
+        return path if path and os.path.isfile(path) else None
+
+    def _effect_for(self, path):
+        effect = self._effects.get(path)
+        if effect is None and QSoundEffect is not None:
+            effect = QSoundEffect(self)
+            effect.setSource(QUrl.fromLocalFile(path))
+            effect.setVolume(self._volume)
+            self._effects[path] = effect
+        return effect
+
+    def load(self, path=None, volume=None):
+        if volume is not None:
+            self._volume = min(max(float(volume), 0.0), 1.0)
+            for effect in self._effects.values():
+                effect.setVolume(self._volume)
+        self._path = self._resolve(path) or BUNDLED_SOUND
+        self._effect_for(self._path)
+
+    def preload(self, path):
+        path = self._resolve(path)
+        if path is not None:
+            self._effect_for(path)
+
+    def play(self, path=None):
+        if self._path is None:
+            self.load()
+        effect = self._effect_for(self._resolve(path) or self._path)
+        if effect is None or effect.status() == QSoundEffect.Status.Error:
+            QApplication.beep()
+            return
+        effect.play()
+
+_alert = None
+
+def alert_sound():
+    global _alert
+    if _alert is None:
+        _alert = AlertSound()
+    return _alert
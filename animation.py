@@ -0,0 +1,81 @@
+import time
+from aqt.qt import QObject, QTimer, Qt, QApplication
+from .metrics import metrics
+from .quality import quality_governor
+
+ANIMATION_DURATION = 800
+FRAME_CAP = 60
+
+FRAME_CAP_OPTIONS = [60, 30, 0]
+
+class AnimationClock(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.duration_ms = ANIMATION_DURATION
+        self.frame_cap = FRAME_CAP
+
+        self._subscribers = {}
+        self._last_frame_ns = None
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._frame)
+
+    def configure(self, duration_ms=None, frame_cap=None):
+        if duration_ms is not None:
+            self.duration_ms = max(int(duration_ms), 0)
+        if frame_cap is not None:
+            self.frame_cap = max(int(frame_cap), 0)
+
+        if not self.enabled():
+            for subscriber in list(self._subscribers):
+                subscriber.finish_animation()
+            self._subscribers.clear()
+            self._timer.stop()
+        elif self._timer.isActive():
+            self._timer.setInterval(self.frame_interval_ms())
+
+    def enabled(self):
+        return self.duration_ms > 0 and self.frame_cap > 0 and quality_governor().animations_enabled()
+
+    def frame_interval_ms(self):
+        fps = quality_governor().frame_cap(self.frame_cap)
+        screen = QApplication.primaryScreen()
+        if screen is not None and screen.refreshRate() > 0:
+            fps = min(fps, screen.refreshRate())
+        return max(int(round(1000.0 / max(fps, 1))), 1)
+
+    def subscribe(self, subscriber):
+        self._subscribers[subscriber] = None
+        if not self._timer.isActive():
+            self._last_frame_ns = None
+            self._timer.start(self.frame_interval_ms())
+
+    def unsubscribe(self, subscriber):
+        self._subscribers.pop(subscriber, None)
+        if not self._subscribers:
+            self._timer.stop()
+
+    def _frame(self):
+        now_ns = time.monotonic_ns()
+        interval_ns = self._timer.interval() * 1_000_000
+        missed = 0
+        if self._last_frame_ns is not None and interval_ns > 0:
+            missed = max((now_ns - self._last_frame_ns) // interval_ns - 1, 0)
+        self._last_frame_ns = now_ns
+        metrics.record_animation_frame(missed)
+
+        for subscriber in list(self._subscribers):
+            subscriber.animation_frame(now_ns)
+
+        if not self._subscribers:
+            self._timer.stop()
+
+_clock = None
+
+def animation_clock():
+    global _clock
+    if _clock is None:
+        _clock = AnimationClock()
+        quality_governor().level_changed.connect(lambda level: _clock.configure())
+    return _clock
@@ -0,0 +1,197 @@
+import os
+import sys
+import types
+
+PACKAGE_NAME = "anki_timer"
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class _Hook:
+    def __init__(self):
+        self._hooks = []
+
+    def append(self, callback):
+        self._hooks.append(callback)
+
+    def remove(self, callback):
+        if callback in self._hooks:
+            self._hooks.remove(callback)
+
+    def __call__(self, *args):
+        for callback in list(self._hooks):
+            callback(*args)
+
+class _GuiHooks:
+    def __getattr__(self, name):
+        hook = _Hook()
+        setattr(self, name, hook)
+        return hook
+
+class _ProfileManager:
+    def __init__(self):
+        self.night = False
+        self.name = "bench"
+
+    def night_mode(self):
+        return self.night
+
+class _AddonManager:
+    def __init__(self):
+        self.configs = {}
+
+    def getConfig(self, module):
+        return dict(self.configs.get(module, {}))
+
+    def writeConfig(self, module, conf):
+        self.configs[module] = dict(conf)
+
+    def addonFromModule(self, module):
+        return module.split(".")[0]
+
+    def addonsFolder(self, module=None):
+        return REPO_DIR if module else os.path.dirname(REPO_DIR)
+
+class _TaskManager:
+    def run_in_background(self, task, on_done=None, *args, **kwargs):
+        from concurrent.futures import Future
+        future = Future()
+        try:
+            future.set_result(task())
+        except Exception as exc:
+            future.set_exception(exc)
+        if on_done is not None:
+            on_done(future)
+        return future
+
+    def run_on_main(self, closure):
+        closure()
+
+class _Menu:
+    def __init__(self):
+        self.actions = []
+
+    def addAction(self, action):
+        self.actions.append(action)
+
+class _Form:
+    def __init__(self):
+        self.menuTools = _Menu()
+
+def _init_main_window(mw):
+    mw.form = _Form()
+    mw.pm = _ProfileManager()
+    mw.addonManager = _AddonManager()
+    mw.taskman = _TaskManager()
+    mw.col = None
+
+class _QueryOp:
+    def __init__(self, parent, op, success):
+        self._op = op
+        self._success = success
+        self._failure = None
+
+    def failure(self, callback):
+        self._failure = callback
+        return self
+
+    def without_collection(self):
+        return self
+
+    def with_progress(self, label=None):
+        return self
+
+    def run_in_background(self):
+        from aqt import mw
+        try:
+            result = self._op(mw.col)
+        except Exception as exc:
+            if self._failure is None:
+                raise
+            self._failure(exc)
+            return
+        self._success(result)
+
+def _noop(*args, **kwargs):
+    return None
+
+def install(night_mode=False, register_package=True):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    if "aqt" in sys.modules and hasattr(sys.modules["aqt"], "_bench_stub"):
+        sys.modules["aqt"].mw.pm.night = night_mode
+        return sys.modules["aqt"].mw
+
+    from PyQt6 import QtCore, QtGui, QtWidgets
+
+    qt = types.ModuleType("aqt.qt")
+    for module in (QtCore, QtGui, QtWidgets):
+        for name in dir(module):
+            if not name.startswith("_"):
+                setattr(qt, name, getattr(module, name))
+    try:
+        from PyQt6 import QtMultimedia
+        for name in dir(QtMultimedia):
+            if not name.startswith("_"):
+                setattr(qt, name, getattr(QtMultimedia, name))
+    except ImportError:
+        pass
+    try:
+        from PyQt6 import QtNetwork
+        for name in dir(QtNetwork):
+            if not name.startswith("_"):
+                setattr(qt, name, getattr(QtNetwork, name))
+    except ImportError:
+        pass
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    class _MainWindow(QtWidgets.QMainWindow):
+        pass
+
+    mw = _MainWindow()
+    mw._bench_app = app
+    _init_main_window(mw)
+    mw.pm.night = night_mode
+
+    operations = types.ModuleType("aqt.operations")
+    operations.QueryOp = _QueryOp
+
+    utils = types.ModuleType("aqt.utils")
+    for name in ("showText", "showInfo", "showWarning", "tooltip", "getSaveFile"):
+        setattr(utils, name, _noop)
+    utils.askUser = lambda *args, **kwargs: False
+
+    aqt = types.ModuleType("aqt")
+    aqt._bench_stub = True
+    aqt.mw = mw
+    aqt.gui_hooks = _GuiHooks()
+    aqt.qt = qt
+    aqt.operations = operations
+    aqt.utils = utils
+    sys.modules["aqt"] = aqt
+    sys.modules["aqt.qt"] = qt
+    sys.modules["aqt.operations"] = operations
+    sys.modules["aqt.utils"] = utils
+
+    if register_package:
+        register_bare_package()
+
+    return mw
+
+def register_bare_package():
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [REPO_DIR]
+        sys.modules[PACKAGE_NAME] = package
+    return sys.modules[PACKAGE_NAME]
+
+def load_addon():
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE_NAME, os.path.join(REPO_DIR, "__init__.py"),
+        submodule_search_locations=[REPO_DIR],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE_NAME] = module
+    spec.loader.exec_module(module)
+    return module
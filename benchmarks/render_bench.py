@@ -0,0 +1,246 @@
+"""Headless paint benchmark for TimerDisplayWidget.
+
+Renders every display mode offscreen into a QImage at several sizes and
+device pixel ratios and reports per-frame timings and Python allocations
+as JSON. Each device pixel ratio runs in its own process because Qt only
+reads QT_SCALE_FACTOR at startup. The adaptive quality governor is
+disabled so every configuration renders at full quality, whatever ran
+before it.
+
+    python benchmarks/render_bench.py --output bench.json
+    python benchmarks/render_bench.py --baseline bench.json --threshold 1.25
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aqt_stub
+
+SIZES = [(260, 200), (400, 320), (1280, 900)]
+DPRS = [1.0, 2.0]
+FRAMES = 120
+FLIP_FRAME_MS = 16
+
+MODE_NAMES = {0: "circular", 1: "focus", 2: "flip", 3: "linear"}
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(int(round(pct / 100.0 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+def _summary(samples_ns, alloc_bytes, alloc_blocks):
+    samples_ms = [s / 1_000_000 for s in samples_ns]
+    frames = max(len(samples_ms), 1)
+    return {
+        "frames": len(samples_ms),
+        "first_ms": samples_ms[0] if samples_ms else 0.0,
+        "mean_ms": sum(samples_ms) / frames,
+        "p50_ms": _percentile(samples_ms, 50),
+        "p90_ms": _percentile(samples_ms, 90),
+        "p99_ms": _percentile(samples_ms, 99),
+        "max_ms": max(samples_ms) if samples_ms else 0.0,
+        "alloc_bytes_per_frame": alloc_bytes / frames,
+        "alloc_blocks_per_frame": alloc_blocks / frames,
+    }
+
+class _Renderer:
+    def __init__(self, widget, dpr):
+        from aqt.qt import QImage, QPainter, Qt
+
+        self.widget = widget
+        self.QPainter = QPainter
+        self.image = QImage(
+            int(widget.width() * dpr), int(widget.height() * dpr),
+            QImage.Format.Format_ARGB32_Premultiplied,
+        )
+        self.image.setDevicePixelRatio(dpr)
+        self.clear_color = Qt.GlobalColor.transparent
+
+    def frame(self):
+        self.image.fill(self.clear_color)
+        start = time.perf_counter_ns()
+        painter = self.QPainter(self.image)
+        self.widget.render(painter)
+        painter.end()
+        return time.perf_counter_ns() - start
+
+def _measure(renderer, step, frames):
+    samples = []
+    for i in range(frames):
+        step(i)
+        samples.append(renderer.frame())
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for i in range(frames):
+        step(i)
+        renderer.frame()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    alloc_bytes = sum(max(stat.size_diff, 0) for stat in stats)
+    alloc_blocks = sum(max(stat.count_diff, 0) for stat in stats)
+    return _summary(samples, alloc_bytes, alloc_blocks)
+
+def _bench_mode(display_widget, render_model, animation, mode, size, dpr, frames, show_cycles):
+    widget = display_widget.TimerDisplayWidget()
+    widget.resize(*size)
+    widget.show()
+    widget.set_display_mode(mode)
+    widget.set_cycle_info(show_cycles, 2, 4)
+    renderer = _Renderer(widget, dpr)
+
+    clock = animation.animation_clock()
+    total = 25 * 60
+
+    def countdown(i):
+        widget.update_time(i / float(total), total - i)
+        widget.finish_animation()
+
+    result = {"steady": _measure(renderer, countdown, frames)}
+
+    if mode == render_model.MODE_FLIP:
+        transition_frames = max(clock.duration_ms // FLIP_FRAME_MS, 1)
+        widget.update_time(0.0, total)
+        widget.finish_animation()
+
+        def transition(i):
+            if i == 0:
+                widget.update_time(0.5, 59 * 60 + 59)
+            widget.animation_frame(widget.anim_start_ns + i * FLIP_FRAME_MS * 1_000_000)
+
+        result["flip_transition"] = _measure(renderer, transition, transition_frames)
+        widget.finish_animation()
+
+    widget.close()
+    widget.deleteLater()
+    return result
+
+def run_single_dpr(dpr, sizes, frames, night_mode):
+    aqt_stub.install(night_mode=night_mode)
+
+    from aqt.qt import QApplication
+    app = QApplication.instance() or QApplication([])
+
+    display_widget = __import__(aqt_stub.PACKAGE_NAME + ".display_widget", fromlist=["display_widget"])
+    render_model = __import__(aqt_stub.PACKAGE_NAME + ".render_model", fromlist=["render_model"])
+    animation = __import__(aqt_stub.PACKAGE_NAME + ".animation", fromlist=["animation"])
+    quality = __import__(aqt_stub.PACKAGE_NAME + ".quality", fromlist=["quality"])
+    quality.quality_governor().set_enabled(False)
+
+    results = []
+    for mode, name in MODE_NAMES.items():
+        for size in sizes:
+            for show_cycles in (False, True):
+                entry = {
+                    "mode": name,
+                    "width": size[0],
+                    "height": size[1],
+                    "dpr": dpr,
+                    "screen_dpr": app.primaryScreen().devicePixelRatio(),
+                    "show_cycles": show_cycles,
+                }
+                entry.update(_bench_mode(display_widget, render_model, animation, mode, size, dpr, frames, show_cycles))
+                results.append(entry)
+                app.processEvents()
+    return results
+
+def _spawn(dpr, args):
+    env = dict(os.environ)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    env["QT_SCALE_FACTOR"] = str(dpr)
+    cmd = [
+        sys.executable, os.path.abspath(__file__),
+        "--single-dpr", str(dpr),
+        "--frames", str(args.frames),
+        "--sizes", ",".join(f"{w}x{h}" for w, h in args.sizes),
+    ]
+    if args.night:
+        cmd.append("--night")
+    out = subprocess.run(cmd, env=env, check=True, capture_output=True, text=True)
+    return json.loads(out.stdout)
+
+def _key(entry):
+    return (entry["mode"], entry["width"], entry["height"], entry["dpr"], entry["show_cycles"])
+
+def compare(results, baseline, threshold):
+    previous = {_key(e): e for e in baseline.get("results", [])}
+    regressions = []
+    for entry in results:
+        old = previous.get(_key(entry))
+        if old is None:
+            continue
+        for scenario in ("steady", "flip_transition"):
+            if scenario not in entry or scenario not in old:
+                continue
+            new_p50 = entry[scenario]["p50_ms"]
+            old_p50 = old[scenario]["p50_ms"]
+            if old_p50 > 0 and new_p50 / old_p50 > threshold:
+                regressions.append({
+                    "key": list(_key(entry)),
+                    "scenario": scenario,
+                    "baseline_p50_ms": old_p50,
+                    "p50_ms": new_p50,
+                })
+    return regressions
+
+def _parse_sizes(text):
+    sizes = []
+    for item in text.split(","):
+        w, h = item.lower().split("x")
+        sizes.append((int(w), int(h)))
+    return sizes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--baseline", help="compare p50 frame times against a previous JSON run")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--sizes", type=_parse_sizes, default=SIZES)
+    parser.add_argument("--dpr", type=float, action="append")
+    parser.add_argument("--night", action="store_true")
+    parser.add_argument("--single-dpr", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.single_dpr is not None:
+        json.dump(run_single_dpr(args.single_dpr, args.sizes, args.frames, args.night), sys.stdout)
+        return 0
+
+    results = []
+    for dpr in args.dpr or DPRS:
+        results.extend(_spawn(dpr, args))
+
+    report = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "frames": args.frames,
+        "results": results,
+    }
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["regressions"] = compare(results, json.load(f), args.threshold)
+        status = 1 if report["regressions"] else 0
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Measure the add-on's startup footprint.
+
+Each measurement runs in a fresh interpreter with the aqt stub installed,
+which also creates the QApplication and main window, the way Anki has
+them ready before it loads add-ons. It reports wall time, Python memory
+allocated and the add-on modules loaded. deferred_ms and deferred_kib
+are the cost moved from Anki startup to the first time the timer opens.
+
+    python benchmarks/startup_bench.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SNIPPET = r"""
+import json, sys, time, tracemalloc
+sys.path.insert(0, {here!r})
+import aqt_stub
+aqt_stub.install(register_package=False)
+before = set(sys.modules)
+tracemalloc.start()
+start = time.perf_counter()
+addon = aqt_stub.load_addon()
+{after}
+elapsed = time.perf_counter() - start
+current, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+loaded = sorted(m for m in set(sys.modules) - before if m.startswith(aqt_stub.PACKAGE_NAME))
+print(json.dumps({{"ms": elapsed * 1000, "alloc_kib": current / 1024, "peak_kib": peak / 1024, "modules": loaded}}))
+"""
+
+SCENARIOS = {
+    "startup": "",
+    "startup_profile_open": "addon.startup_check()",
+    "first_use": "addon.toggle_timer()",
+}
+
+def measure(after, runs):
+    samples = []
+    for _ in range(runs):
+        code = SNIPPET.format(here=HERE, after=after)
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        out = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True)
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    samples.sort(key=lambda s: s["ms"])
+    return samples[len(samples) // 2]
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    report = {name: measure(after, runs) for name, after in SCENARIOS.items()}
+    report["deferred_ms"] = report["first_use"]["ms"] - report["startup"]["ms"]
+    report["deferred_kib"] = report["first_use"]["alloc_kib"] - report["startup"]["alloc_kib"]
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
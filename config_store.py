@@ -0,0 +1,75 @@
+import threading
+from aqt import mw
+from aqt.qt import QObject, QTimer
+
+SAVE_DEBOUNCE_MS = 750
+
+class ConfigStore(QObject):
+    def __init__(self, module_name, parent=None):
+        super().__init__(parent)
+        self.module_name = module_name
+
+        self._persisted = dict(mw.addonManager.getConfig(module_name) or {})
+        self._pending = {}
+
+        self._write_lock = threading.Lock()
+        self._write_seq = 0
+        self._written_seq = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        debounce_ms = self._persisted.get('save_debounce_ms', SAVE_DEBOUNCE_MS)
+        self._timer.setInterval(max(int(debounce_ms), 0))
+        self._timer.timeout.connect(self.flush)
+
+    def get(self, key, default=None):
+        if key in self._pending:
+            return self._pending[key]
+        return self._persisted.get(key, default)
+
+    def snapshot(self):
+        config = dict(self._persisted)
+        config.update(self._pending)
+        return config
+
+    def is_dirty(self):
+        return bool(self._pending)
+
+    def update(self, values):
+        for key, value in values.items():
+            if key in self._persisted and self._persisted[key] == value:
+                self._pending.pop(key, None)
+            else:
+                self._pending[key] = value
+
+        if not self._pending:
+            self._timer.stop()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self, blocking=False):
+        self._timer.stop()
+        if not self._pending:
+            return
+
+        config = self.snapshot()
+        self._persisted = config
+        self._pending = {}
+
+        self._write_seq += 1
+        seq = self._write_seq
+
+        if blocking:
+            self._write(seq, config)
+        else:
+            mw.taskman.run_in_background(
+                lambda: self._write(seq, config),
+                lambda fut: fut.result(),
+            )
+
+    def _write(self, seq, config):
+        with self._write_lock:
+            if seq < self._written_seq:
+                return
+            mw.addonManager.writeConfig(self.module_name, config)
+            self._written_seq = seq
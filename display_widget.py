@@ -0,0 +1,483 @@
+import time
+import math
+from aqt.qt import QWidget, QPainter, QRect, QRectF, QPointF, QPixmap, Qt
+from .render_model import TimerRenderModel, MODE_CIRCULAR, MODE_FOCUS, MODE_FLIP, MODE_LINEAR, CARD_CACHE_LIMIT
+from .palette import MAX_SHADOW_ALPHA
+from .text_cache import SEPARATOR
+from .metrics import metrics
+from .quality import quality_governor
+
+LINEAR_BAR_HEIGHT = 12
+LINEAR_BAR_MARGIN = 20
+LINEAR_BAR_Y = 15
+
+CARD_MARGIN = 2.0
+
+class TimerDisplayWidget(QWidget):
+    def __init__(self, model=None, parent=None):
+        super().__init__(parent)
+        self.model = model or TimerRenderModel(self)
+        self.setMinimumHeight(180)
+        self.zoom = 1.0
+
+        self._anim_rects = []
+        self._background = None
+        self._background_key = None
+
+        self.model.attach(self)
+        quality_governor().level_changed.connect(self._on_quality_changed)
+
+    def _on_quality_changed(self, level):
+        self.update()
+
+    @property
+    def custom_text_color(self):
+        return self.model.custom_text_color
+
+    @property
+    def custom_ring_color(self):
+        return self.model.custom_ring_color
+
+    @property
+    def anim_start_ns(self):
+        return self.model.anim_start_ns
+
+    def refresh_theme(self):
+        self.model.refresh_theme()
+
+    def clear_render_cache(self):
+        self.model.clear_render_cache()
+        self._background = None
+        self._background_key = None
+
+    def set_display_mode(self, mode_index):
+        self.model.set_display_mode(mode_index)
+
+    def set_custom_colors(self, text_col, ring_col):
+        self.model.set_custom_colors(text_col, ring_col)
+
+    def set_phase_color(self, color):
+        self.model.set_phase_color(color)
+
+    def set_cycle_info(self, active, current, total, label=None):
+        self.model.set_cycle_info(active, current, total, label)
+
+    def update_time(self, progress, seconds_to_show):
+        self.model.update_time(progress, seconds_to_show)
+
+    def animation_frame(self, now_ns):
+        self.model.animation_frame(now_ns)
+
+    def finish_animation(self):
+        self.model.finish_animation()
+
+    def set_zoom(self, zoom):
+        zoom = max(float(zoom), 0.1)
+        if zoom != self.zoom:
+            self.zoom = zoom
+            self._background = None
+            self._background_key = None
+            self.update()
+
+    def _view_width(self):
+        return int(self.width() / self.zoom)
+
+    def _view_height(self):
+        return int(self.height() / self.zoom)
+
+    def _view_rect(self):
+        return QRect(0, 0, self._view_width(), self._view_height())
+
+    def _pixel_ratio(self):
+        return self.devicePixelRatioF() * self.zoom
+
+    def theme_changed(self):
+        self._background = None
+        self._background_key = None
+        self.update()
+
+    def cycle_info_changed(self, layout_changed):
+        if layout_changed:
+            self.update()
+        else:
+            self._update_rects([self._cycle_rect()])
+
+    def time_changed(self, old_parts, new_parts, old_progress, needs_anim, was_animating):
+        model = self.model
+        if needs_anim:
+            old_h, old_m, old_s = old_parts
+            new_h, new_m, new_s = new_parts
+            if new_h != old_h:
+                rects = [QRectF(self._view_rect())]
+            else:
+                _, rect_min, rect_sec, _ = self._flip_layout(model.has_hours())
+                rects = []
+                if new_m != old_m:
+                    rects.append(QRectF(self._card_bounds(rect_min)))
+                if new_s != old_s:
+                    rects.append(QRectF(self._card_bounds(rect_sec)))
+            if was_animating:
+                rects.extend(r for r in self._anim_rects if r not in rects)
+            self._anim_rects = rects
+            if model.anim_progress >= 1.0:
+                self._update_rects(rects)
+            return
+
+        if model.display_mode == MODE_FLIP:
+            return
+
+        dirty = []
+        if new_parts != old_parts:
+            dirty.append(self._text_rect())
+        if model.progress != old_progress and self._progress_rect() is not None:
+            dirty.append(self._progress_rect())
+        self._update_rects(dirty)
+
+    def animation_changed(self):
+        self._update_rects(self._anim_rects)
+
+    def is_rendering(self):
+        if not self.isVisible():
+            return False
+        return not self.window().isMinimized()
+
+    def resizeEvent(self, event):
+        self._background = None
+        self._background_key = None
+        super().resizeEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.model.anim_progress < 1.0:
+            self._anim_rects = [QRectF(self._view_rect())]
+        self.update()
+
+    def _text_parts(self):
+        h_str, m_str, s_str = self.model.time_parts
+        if h_str != "00":
+            return (h_str, SEPARATOR, m_str, SEPARATOR, s_str)
+        return (m_str, SEPARATOR, s_str)
+
+    def paintEvent(self, event):
+        start_ns = time.perf_counter_ns()
+        dirty = event.rect()
+        governor = quality_governor()
+        painter = QPainter(self)
+        if self.zoom != 1.0:
+            painter.scale(self.zoom, self.zoom)
+            dirty = QRectF(dirty.x() / self.zoom, dirty.y() / self.zoom,
+                           dirty.width() / self.zoom, dirty.height() / self.zoom).toAlignedRect()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, governor.antialias() or self.model.display_mode != MODE_FLIP)
+        self._draw_background(painter)
+        
+        if self.model.display_mode == MODE_FLIP:
+            self._draw_flip_style(painter, dirty)
+        elif self.model.display_mode == MODE_LINEAR:
+            self._draw_linear_style(painter)
+        else:
+            self._draw_standard_modes(painter)
+
+        if self.model.show_cycles and dirty.intersects(self._cycle_rect().toAlignedRect()):
+            self._draw_cycle_counter(painter)
+
+        painter.end()
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        metrics.record_paint(self.model.display_mode, elapsed_ns)
+        governor.record(elapsed_ns / 1_000_000)
+
+    def _text_rect(self):
+        if self.model.display_mode == MODE_LINEAR:
+            text_y_pos = LINEAR_BAR_Y + LINEAR_BAR_HEIGHT + 20
+            return QRectF(0, text_y_pos, self._view_width(), self._view_height() - text_y_pos)
+        center_y = self._content_center_y()
+        return QRectF(0, center_y - 50, self._view_width(), 100)
+
+    def _progress_rect(self):
+        if self.model.display_mode == MODE_CIRCULAR:
+            return self._circle_rect().adjusted(-6, -6, 6, 6)
+        if self.model.display_mode == MODE_LINEAR:
+            return self._track_rect().adjusted(-2, -2, 2, 2)
+        return None
+
+    def _cycle_rect(self):
+        return QRectF(0, self._view_height() - 25, self._view_width(), 25)
+
+    def _update_rects(self, rects):
+        zoom = self.zoom
+        for r in rects:
+            if zoom != 1.0:
+                r = QRectF(r.x() * zoom, r.y() * zoom, r.width() * zoom, r.height() * zoom)
+            self.update(r.toAlignedRect())
+
+    def _content_center_y(self):
+        center_y = self._view_rect().center().y()
+        if self.model.show_cycles:
+            center_y -= 15
+        return center_y
+
+    def _circle_rect(self):
+        rect = self._view_rect()
+        center_y = self._content_center_y()
+        avail_height = rect.height() - (30 if self.model.show_cycles else 0)
+        size = min(rect.width(), avail_height) - 40
+        return QRectF(rect.center().x() - size/2, center_y - size/2, size, size)
+
+    def _track_rect(self):
+        return QRectF(LINEAR_BAR_MARGIN, LINEAR_BAR_Y, self._view_width() - (LINEAR_BAR_MARGIN*2), LINEAR_BAR_HEIGHT)
+
+    def _draw_background(self, painter):
+        if self.model.display_mode not in (MODE_CIRCULAR, MODE_LINEAR):
+            return
+
+        dpr = self._pixel_ratio()
+        key = (self.model.display_mode, self._view_width(), self._view_height(), dpr, self.model.show_cycles)
+        if self._background is None or self._background_key != key:
+            self._background = self._render_background(dpr)
+            self._background_key = key
+
+        painter.drawPixmap(0, 0, self._background)
+
+    def _render_background(self, dpr):
+        colors = self.model.colors
+        pixmap = QPixmap(math.ceil(self._view_width() * dpr), math.ceil(self._view_height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if self.model.display_mode == MODE_CIRCULAR:
+            painter.setPen(colors.track_pen)
+            painter.drawEllipse(self._circle_rect())
+        else:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(colors.track_brush)
+            painter.drawRoundedRect(self._track_rect(), LINEAR_BAR_HEIGHT/2, LINEAR_BAR_HEIGHT/2)
+
+        painter.end()
+        return pixmap
+
+    def _draw_standard_modes(self, painter):
+        colors = self.model.colors
+        parts = self._text_parts()
+
+        if self.model.display_mode == MODE_CIRCULAR and self.model.progress > 0:
+            painter.setPen(colors.progress_pen)
+            span_angle = int(-360 * self.model.progress * 16)
+            painter.drawArc(self._circle_rect(), 90 * 16, span_angle)
+
+        painter.setPen(colors.text_pen) 
+        
+        base_size = 60 if self.model.display_mode == MODE_FOCUS else 28
+        if len(parts) > 3: 
+            base_size = int(base_size * 0.75)
+            
+        font = self.model.text_cache.font(self.font(), point_size=base_size)
+        self.model.text_cache.draw_parts(painter, self._text_rect(), parts, font)
+
+    def _draw_linear_style(self, painter):
+        colors = self.model.colors
+        track_rect = self._track_rect()
+        
+        if self.model.progress > 0:
+            fill_width = track_rect.width() * self.model.progress
+            fill_width = max(fill_width, LINEAR_BAR_HEIGHT) 
+            
+            fill_rect = QRectF(track_rect.x(), track_rect.y(), fill_width, track_rect.height())
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(colors.bar_brush)
+            painter.drawRoundedRect(fill_rect, LINEAR_BAR_HEIGHT/2, LINEAR_BAR_HEIGHT/2)
+
+        parts = self._text_parts()
+        
+        painter.setPen(colors.text_pen)
+        font = self.model.text_cache.font(self.font(), point_size=48 if len(parts) <= 3 else 36)
+        self.model.text_cache.draw_parts(painter, self._text_rect(), parts, font, align_top=True)
+
+    def _draw_cycle_counter(self, painter):
+        font = self.model.text_cache.font(self.font(), bold=False, point_size=10)
+        painter.setPen(self.model.colors.cycle_pen)
+        
+        if self.model.total_cycles > 0:
+            text = f"Ciclo: {self.model.current_cycle:02d} / {self.model.total_cycles:02d}"
+        else:
+            text = f"Ciclo: {self.model.current_cycle:02d}"
+        if self.model.cycle_label:
+            text = f"{self.model.cycle_label} · {text}"
+            
+        self.model.text_cache.draw_parts(painter, self._cycle_rect(), (text,), font)
+
+    def _ease_in_out(self, t):
+        if t < 0.5: return 2 * t * t
+        return -1 + (4 - 2 * t) * t
+
+    def _flip_layout(self, has_hours):
+        rect = self._view_rect()
+        center_x = rect.center().x()
+        center_y = self._content_center_y()
+        
+        avail_height = rect.height() - (30 if self.model.show_cycles else 0)
+        
+        if has_hours:
+            card_width = min(self._view_width() * 0.28, 90)
+            gap = 8
+        else:
+            card_width = min(self._view_width() * 0.42, 140)
+            gap = 12
+            
+        card_height = min(avail_height * 0.75, 180)
+        
+        pixel_size = int(card_height * 0.55)
+
+        if has_hours:
+            pixel_size = min(pixel_size, int(card_width * 0.75))
+
+        if has_hours:
+            total_w = (3 * card_width) + (2 * gap)
+            start_x = center_x - (total_w / 2)
+            
+            rect_hour = QRectF(start_x, center_y - card_height/2, card_width, card_height)
+            rect_min = QRectF(start_x + card_width + gap, center_y - card_height/2, card_width, card_height)
+            rect_sec = QRectF(start_x + (card_width + gap)*2, center_y - card_height/2, card_width, card_height)
+        else:
+            rect_hour = None
+            rect_min = QRectF(center_x - card_width - gap/2, center_y - card_height/2, card_width, card_height)
+            rect_sec = QRectF(center_x + gap/2, center_y - card_height/2, card_width, card_height)
+
+        return rect_hour, rect_min, rect_sec, pixel_size
+
+    def _draw_flip_style(self, painter, dirty):
+        rect_hour, rect_min, rect_sec, pixel_size = self._flip_layout(self.model.has_hours())
+        radius = 10
+        
+        font = self.model.text_cache.font(self.font(), pixel_size=pixel_size, family="Arial")
+        painter.setFont(font)
+
+        visual_progress = self._ease_in_out(self.model.anim_progress)
+
+        prev_h, prev_m, prev_s = self.model.prev_parts
+        curr_h, curr_m, curr_s = self.model.curr_parts
+        cards = [(rect_min, prev_m, curr_m), (rect_sec, prev_s, curr_s)]
+        if rect_hour is not None:
+            cards.insert(0, (rect_hour, prev_h, curr_h))
+
+        for r, prev, curr in cards:
+            if not dirty.intersects(self._card_bounds(r)):
+                continue
+            if prev != curr and self.model.anim_progress < 1.0:
+                self._draw_animated_card(painter, r, prev, curr, visual_progress, radius)
+            else:
+                self._draw_static_card(painter, r, curr, radius)
+
+    def _card_bounds(self, r):
+        return r.adjusted(-4, -4, 4, 4).toAlignedRect()
+
+    def _draw_static_card(self, painter, r, text, radius):
+        self._draw_card_half(painter, r, text, radius, is_top=True)
+        self._draw_card_half(painter, r, text, radius, is_top=False)
+        self._draw_split_line(painter, r)
+
+    def _draw_animated_card(self, painter, r, old_text, new_text, progress, radius):
+        self._draw_card_half(painter, r, new_text, radius, is_top=True)
+        self._draw_card_half(painter, r, old_text, radius, is_top=False)
+
+        center_y = r.center().y()
+        
+        if progress < 0.5:
+            scale = 1.0 - (progress * 2)
+            painter.save()
+            painter.translate(r.center().x(), center_y)
+            painter.scale(1.0, scale)
+            painter.translate(-r.center().x(), -center_y)
+            self._draw_card_half(painter, r, old_text, radius, is_top=True)
+            self._draw_shadow(painter, r, alpha=int(progress * 220), is_top=True)
+            painter.restore()
+        else:
+            scale = (progress - 0.5) * 2
+            painter.save()
+            painter.translate(r.center().x(), center_y)
+            painter.scale(1.0, scale)
+            painter.translate(-r.center().x(), -center_y)
+            self._draw_card_half(painter, r, new_text, radius, is_top=False)
+            self._draw_shadow(painter, r, alpha=int((1.0 - progress) * 220), is_top=False)
+            painter.restore()
+
+        self._draw_split_line(painter, r)
+
+    def _draw_card_half(self, painter, r, text, radius, is_top):
+        pixmap = self._get_card_half(r, text, radius, is_top, painter.font())
+        top = r.top() - CARD_MARGIN if is_top else r.center().y()
+        painter.drawPixmap(QPointF(r.left() - CARD_MARGIN, top), pixmap)
+
+    def _get_card_half(self, r, text, radius, is_top, font):
+        dpr = self._pixel_ratio()
+        text_rgba = self.model.custom_text_color.rgba() if self.model.custom_text_color else None
+        antialias = quality_governor().antialias()
+        key = (text, is_top, round(r.width(), 2), round(r.height(), 2), font.pixelSize(), dpr, text_rgba, antialias)
+
+        pixmap = self.model.card_cache.get(key)
+        if pixmap is not None:
+            self.model.card_cache.move_to_end(key)
+            return pixmap
+
+        pixmap = self._render_card_half(r.width(), r.height(), text, radius, is_top, font, dpr, antialias)
+        self.model.card_cache[key] = pixmap
+        if len(self.model.card_cache) > CARD_CACHE_LIMIT:
+            self.model.card_cache.popitem(last=False)
+        return pixmap
+
+    def _render_card_half(self, width, height, text, radius, is_top, font, dpr, antialias):
+        half_h = height / 2 + CARD_MARGIN
+        pixmap = QPixmap(math.ceil((width + CARD_MARGIN * 2) * dpr), math.ceil(half_h * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        if is_top:
+            r = QRectF(CARD_MARGIN, CARD_MARGIN, width, height)
+        else:
+            r = QRectF(CARD_MARGIN, -height / 2, width, height)
+
+        colors = self.model.colors
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, antialias)
+        painter.setFont(font)
+
+        painter.setPen(colors.card_border_pen)
+        painter.setBrush(colors.card_brush)
+        painter.drawRoundedRect(r, radius, radius)
+
+        painter.setPen(colors.card_text_pen)
+        painter.drawText(r, Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        return pixmap
+
+    def _draw_shadow(self, painter, r, alpha, is_top):
+        if alpha <= 0: return
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.model.colors.shadow_brushes[min(alpha, MAX_SHADOW_ALPHA)])
+        
+        center_y = r.center().y()
+        if is_top:
+            rect = QRectF(r.left(), r.top(), r.width(), r.height() / 2)
+        else:
+            rect = QRectF(r.left(), center_y, r.width(), r.height() / 2)
+        painter.drawRoundedRect(rect, 0, 0)
+
+    def _draw_split_line(self, painter, r):
+        center_y = r.center().y()
+        colors = self.model.colors
+        painter.setPen(colors.split_pen)
+        p1 = QPointF(r.left()+1, center_y)
+        p2 = QPointF(r.right()-1, center_y)
+        painter.drawLine(p1, p2)
+        
+        hinge_w, hinge_h = 6, 10
+        painter.setPen(colors.hinge_pen)
+        painter.setBrush(colors.hinge_brush)
+        
+        h_left = QRectF(r.left() - 2, center_y - hinge_h/2, hinge_w, hinge_h)
+        h_right = QRectF(r.right() - hinge_w + 2, center_y - hinge_h/2, hinge_w, hinge_h)
+        
+        painter.drawRoundedRect(h_left, 2, 2)
+        painter.drawRoundedRect(h_right, 2, 2)
+
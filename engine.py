@@ -0,0 +1,296 @@
+import time
+from .state import STOPPED, RUNNING, PAUSED
+
+NS_PER_SEC = 1_000_000_000
+NS_PER_MS = 1_000_000
+
+EVENT_START = "start"
+EVENT_PAUSE = "pause"
+EVENT_RESUME = "resume"
+EVENT_CYCLE_COMPLETE = "cycle_complete"
+EVENT_STOP = "stop"
+EVENT_TICK = "tick"
+EVENT_CYCLE = "cycle"
+EVENT_PHASE = "phase"
+
+class MonotonicClock:
+    def now_ns(self):
+        return time.monotonic_ns()
+
+    def wall_ms(self):
+        return int(time.time() * 1000)
+
+class SimulatedClock:
+    def __init__(self, now_ns=0, wall_ms=0):
+        self._now_ns = now_ns
+        self._wall_offset_ms = wall_ms - now_ns // NS_PER_MS
+
+    def now_ns(self):
+        return self._now_ns
+
+    def wall_ms(self):
+        return self._now_ns // NS_PER_MS + self._wall_offset_ms
+
+    def advance(self, seconds=0, ns=0):
+        self._now_ns += int(seconds * NS_PER_SEC) + ns
+        return self._now_ns
+
+class TimerEngine:
+    def __init__(self, clock=None):
+        self.clock = clock or MonotonicClock()
+        self.state = STOPPED
+        self.total_seconds = 0
+        self.loop = False
+        self.cycles = 0
+        self.current_cycle = 1
+        self.cycle_started_ms = 0
+        self.schedule = None
+        self.phase_index = 0
+        self._elapsed_base_ns = 0
+        self._run_start_ns = None
+        self._focus_base_ns = 0
+        self._tick_ns = 0
+        self._listeners = []
+
+    def subscribe(self, listener):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _emit(self, kind, elapsed_seconds):
+        for listener in self._listeners:
+            listener(kind, self, elapsed_seconds)
+
+    def configure(self, total_seconds, loop=False, cycles=0, schedule=None):
+        self.schedule = schedule if schedule else None
+        if self.schedule is not None:
+            total_seconds = self.schedule.total_seconds
+        self.total_seconds = max(int(total_seconds), 0)
+        self.loop = bool(loop)
+        self.cycles = max(int(cycles), 0)
+        self.phase_index = 0
+
+    def phase(self):
+        if self.schedule is None:
+            return None
+        return self.schedule.phases[self.phase_index]
+
+    def _sync_phase(self, elapsed_ns):
+        if self.schedule is None:
+            return False
+        index = self.schedule.index_at(elapsed_ns / NS_PER_SEC)
+        if index == self.phase_index:
+            return False
+        self.phase_index = index
+        return True
+
+    def _segment_ns(self):
+        if self.schedule is None:
+            return 0, self.total_seconds * NS_PER_SEC
+        start, end = self.schedule.bounds(self.phase_index)
+        return start * NS_PER_SEC, end * NS_PER_SEC
+
+    def _now_ns(self):
+        return max(self.clock.now_ns(), self._tick_ns)
+
+    @property
+    def is_stopwatch(self):
+        return self.total_seconds == 0
+
+    def elapsed_ns(self, now_ns=None):
+        if self._run_start_ns is None:
+            return self._elapsed_base_ns
+        if now_ns is None:
+            now_ns = self._now_ns()
+        return self._elapsed_base_ns + (now_ns - self._run_start_ns)
+
+    @property
+    def elapsed_seconds(self):
+        return self.elapsed_ns() / NS_PER_SEC
+
+    def _work_ns(self, elapsed_ns):
+        if not self.is_stopwatch:
+            elapsed_ns = min(elapsed_ns, self.total_seconds * NS_PER_SEC)
+        if self.schedule is None:
+            return elapsed_ns
+        return int(self.schedule.work_seconds_at(elapsed_ns / NS_PER_SEC) * NS_PER_SEC)
+
+    def focus_ns(self, now_ns=None):
+        if self._run_start_ns is None:
+            return self._focus_base_ns
+        return self._focus_base_ns + self._work_ns(self.elapsed_ns(now_ns)) - self._work_ns(self._elapsed_base_ns)
+
+    @property
+    def focus_seconds(self):
+        return self.focus_ns() / NS_PER_SEC
+
+    def display_seconds(self, now_ns=None):
+        elapsed_ns = self.elapsed_ns(now_ns)
+        if self.is_stopwatch:
+            return elapsed_ns // NS_PER_SEC
+        remaining_ns = self._segment_ns()[1] - elapsed_ns
+        return max(-(-remaining_ns // NS_PER_SEC), 0)
+
+    def progress(self, now_ns=None):
+        if self.is_stopwatch:
+            return 1.0 if self.state != STOPPED else 0.0
+        start_ns, end_ns = self._segment_ns()
+        return min(max((self.elapsed_ns(now_ns) - start_ns) / (end_ns - start_ns), 0.0), 1.0)
+
+    def start(self):
+        if self.state == RUNNING:
+            return False
+        event = EVENT_RESUME
+        if self.state == STOPPED:
+            if self.cycles > 0 and self.current_cycle > self.cycles:
+                self.current_cycle = 1
+            self._elapsed_base_ns = 0
+            self._focus_base_ns = 0
+            self.phase_index = 0
+            self.cycle_started_ms = self.clock.wall_ms()
+            event = EVENT_START
+        self.state = RUNNING
+        self._tick_ns = 0
+        self._run_start_ns = self.clock.now_ns()
+        self._emit(event, self._elapsed_base_ns / NS_PER_SEC)
+        if event == EVENT_START and self.schedule is not None:
+            self._emit(EVENT_PHASE, 0.0)
+        return True
+
+    def pause(self):
+        if self.state != RUNNING:
+            return False
+        now_ns = self._now_ns()
+        self._focus_base_ns = self.focus_ns(now_ns)
+        self._elapsed_base_ns = self.elapsed_ns(now_ns)
+        self._run_start_ns = None
+        self.state = PAUSED
+        self._emit(EVENT_PAUSE, self._elapsed_base_ns / NS_PER_SEC)
+        return True
+
+    def toggle(self):
+        if self.state == RUNNING:
+            return self.pause()
+        return self.start()
+
+    def stop(self):
+        was_active = self.state != STOPPED
+        now_ns = self._now_ns()
+        elapsed = self.elapsed_ns(now_ns) / NS_PER_SEC
+        self._focus_base_ns = self.focus_ns(now_ns)
+        self.state = STOPPED
+        self._elapsed_base_ns = 0
+        self._run_start_ns = None
+        if was_active:
+            self._emit(EVENT_STOP, elapsed)
+            if self.state != STOPPED:
+                return
+        self.cycle_started_ms = 0
+        self.current_cycle = 1
+        self.phase_index = 0
+
+    def snapshot(self, now_ns=None):
+        return {
+            'state': self.state,
+            'total_seconds': self.total_seconds,
+            'loop': self.loop,
+            'cycles': self.cycles,
+            'current_cycle': self.current_cycle,
+            'elapsed_ms': self.elapsed_ns(now_ns) // NS_PER_MS,
+            'focus_ms': self.focus_ns(now_ns) // NS_PER_MS,
+            'cycle_started_ms': self.cycle_started_ms,
+        }
+
+    def restore(self, data, schedule=None):
+        self.configure(data.get('total_seconds', 0), data.get('loop', False), data.get('cycles', 0), schedule)
+        self.current_cycle = max(int(data.get('current_cycle', 1)), 1)
+        self.cycle_started_ms = int(data.get('cycle_started_ms', 0))
+        elapsed_ns = max(int(data.get('elapsed_ms', 0)), 0) * NS_PER_MS
+        if not self.is_stopwatch:
+            elapsed_ns = min(elapsed_ns, self.total_seconds * NS_PER_SEC)
+        self._elapsed_base_ns = elapsed_ns
+        self._focus_base_ns = max(int(data.get('focus_ms', 0)), 0) * NS_PER_MS
+        self._run_start_ns = None
+        self.state = PAUSED
+        self._sync_phase(elapsed_ns)
+
+    def next_deadline_ns(self, now_ns=None):
+        if self.state != RUNNING:
+            return None
+        next_second = self.elapsed_ns(now_ns) // NS_PER_SEC + 1
+        if not self.is_stopwatch:
+            next_second = min(next_second, self.total_seconds)
+        return self._run_start_ns + next_second * NS_PER_SEC - self._elapsed_base_ns
+
+    def tick(self, now_ns=None):
+        if self.state != RUNNING:
+            return
+        if now_ns is None:
+            now_ns = self._now_ns()
+        self._tick_ns = now_ns
+        elapsed_ns = self.elapsed_ns(now_ns)
+        total_ns = self.total_seconds * NS_PER_SEC
+
+        if self.is_stopwatch or elapsed_ns < total_ns:
+            if self._sync_phase(elapsed_ns):
+                self._emit(EVENT_PHASE, elapsed_ns / NS_PER_SEC)
+            self._emit(EVENT_TICK, elapsed_ns / NS_PER_SEC)
+            return
+
+        self._emit(EVENT_CYCLE_COMPLETE, self.total_seconds)
+        if self.state != RUNNING:
+            return
+        if self.loop and (self.cycles == 0 or self.current_cycle < self.cycles):
+            overshoot_ns = elapsed_ns - total_ns
+            self._elapsed_base_ns = 0
+            self._focus_base_ns = 0
+            self._run_start_ns = now_ns - overshoot_ns
+            self.cycle_started_ms = self.clock.wall_ms() - (self.clock.now_ns() - self._run_start_ns) // NS_PER_MS
+            self.current_cycle += 1
+            self._sync_phase(overshoot_ns)
+            self._emit(EVENT_CYCLE, overshoot_ns / NS_PER_SEC)
+            if self.schedule is not None:
+                self._emit(EVENT_PHASE, overshoot_ns / NS_PER_SEC)
+        else:
+            self._elapsed_base_ns = 0
+            self._focus_base_ns = 0
+            self._run_start_ns = None
+            self.stop()
+
+    def seek(self, elapsed_ns):
+        if self.state == STOPPED or self.is_stopwatch:
+            return False
+        now_ns = self._now_ns()
+        self._focus_base_ns = self.focus_ns(now_ns)
+        self._elapsed_base_ns = min(max(int(elapsed_ns), 0), self.total_seconds * NS_PER_SEC)
+        if self.state == RUNNING:
+            self._run_start_ns = now_ns
+            self.tick(now_ns)
+        else:
+            if self._sync_phase(self._elapsed_base_ns):
+                self._emit(EVENT_PHASE, self._elapsed_base_ns / NS_PER_SEC)
+            self._emit(EVENT_TICK, self._elapsed_base_ns / NS_PER_SEC)
+        return True
+
+    def skip_phase(self):
+        if self.schedule is None:
+            return self.seek(self.total_seconds * NS_PER_SEC)
+        return self.seek(self.schedule.ends[self.phase_index] * NS_PER_SEC)
+
+    def jump_to_phase(self, index):
+        if self.schedule is None or not 0 <= index < len(self.schedule):
+            return False
+        return self.seek(self.schedule.starts[index] * NS_PER_SEC)
+
+    def advance_to(self, now_ns):
+        if self.state == RUNNING and not self.is_stopwatch:
+            total_ns = self.total_seconds * NS_PER_SEC
+            while self.state == RUNNING:
+                boundary_ns = self._run_start_ns + total_ns - self._elapsed_base_ns
+                if boundary_ns > now_ns:
+                    break
+                self.tick(boundary_ns)
+        self.tick(now_ns)
@@ -0,0 +1,131 @@
+import threading
+from aqt import mw
+from aqt.qt import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QComboBox, QCheckBox, QDateEdit,
+    QPushButton, QProgressBar, QFileDialog, QDate, Qt
+)
+from .session_store import session_store
+from .history_export import export_events, ExportCancelled, FORMAT_CSV, FORMAT_JSONL
+
+FORMAT_OPTIONS = [
+    ("CSV", FORMAT_CSV, "CSV (*.csv)"),
+    ("JSON Lines", FORMAT_JSONL, "JSON Lines (*.jsonl)"),
+]
+
+class ExportDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Exportar histórico do Timer")
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+
+        self.format_combo = QComboBox()
+        self.format_combo.addItems([label for label, _, _ in FORMAT_OPTIONS])
+        form.addRow("Formato:", self.format_combo)
+
+        self.range_cb = QCheckBox("Filtrar por período")
+        self.range_cb.stateChanged.connect(self._update_range)
+        form.addRow(self.range_cb)
+
+        today = QDate.currentDate()
+        self.first_date = QDateEdit(today.addMonths(-1))
+        self.first_date.setCalendarPopup(True)
+        self.last_date = QDateEdit(today)
+        self.last_date.setCalendarPopup(True)
+        form.addRow("De:", self.first_date)
+        form.addRow("Até:", self.last_date)
+
+        self.profile_cb = QCheckBox(f"Apenas o perfil atual ({mw.pm.name or ''})")
+        self.profile_cb.setChecked(True)
+        form.addRow(self.profile_cb)
+        layout.addLayout(form)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.status_label = QLabel()
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        self.btn_export = QPushButton("Exportar")
+        self.btn_export.clicked.connect(self.start_export)
+        self.btn_close = QPushButton("Fechar")
+        self.btn_close.clicked.connect(self.reject)
+        buttons.addWidget(self.btn_export)
+        buttons.addWidget(self.btn_close)
+        layout.addLayout(buttons)
+
+        self._cancel = threading.Event()
+        self._running = False
+        self._closed = False
+        self._update_range()
+
+    def _update_range(self, *args):
+        enabled = self.range_cb.isChecked()
+        self.first_date.setEnabled(enabled)
+        self.last_date.setEnabled(enabled)
+
+    def done(self, result):
+        self._closed = True
+        self._cancel.set()
+        super().done(result)
+
+    def start_export(self):
+        if self._running:
+            self._cancel.set()
+            return
+
+        _, fmt, file_filter = FORMAT_OPTIONS[self.format_combo.currentIndex()]
+        path, _ = QFileDialog.getSaveFileName(self, "Exportar histórico", f"study_timer.{fmt}", file_filter)
+        if not path:
+            return
+
+        first_day = last_day = None
+        if self.range_cb.isChecked():
+            first_day = self.first_date.date().toString("yyyy-MM-dd")
+            last_day = self.last_date.date().toString("yyyy-MM-dd")
+        profile = (mw.pm.name or "") if self.profile_cb.isChecked() else None
+
+        self._cancel.clear()
+        self._running = True
+        self.btn_export.setText("Cancelar")
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self.status_label.setText("Exportando…")
+
+        store = session_store()
+        store.flush()
+        future = store.submit(
+            export_events, path, fmt, profile, first_day, last_day,
+            self._on_progress, self._cancel.is_set,
+        )
+        future.add_done_callback(lambda fut: mw.taskman.run_on_main(lambda: self._finished(fut, path)))
+
+    def _on_progress(self, done, total):
+        mw.taskman.run_on_main(lambda: self._show_progress(done, total))
+
+    def _show_progress(self, done, total):
+        if self._closed or self._cancel.is_set():
+            return
+        self.progress_bar.setRange(0, max(total, 1))
+        self.progress_bar.setValue(done)
+        self.status_label.setText(f"{done} de {total} eventos")
+
+    def _finished(self, future, path):
+        if self._closed:
+            return
+        self._running = False
+        self.btn_export.setText("Exportar")
+        self.progress_bar.setVisible(False)
+        try:
+            count = future.result()
+        except ExportCancelled:
+            self.status_label.setText("Exportação cancelada.")
+            return
+        except Exception as exc:
+            self.status_label.setText(f"Não foi possível exportar: {exc}")
+            return
+        self.status_label.setText(f"{count} eventos exportados para {path}")
@@ -0,0 +1,91 @@
+import csv
+import json
+import os
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+EXPORT_FORMATS = (FORMAT_CSV, FORMAT_JSONL)
+
+EXPORT_CHUNK = 2000
+
+EXPORT_COLUMNS = (
+    "id", "ts_ms", "day", "profile", "kind", "op_mode", "cycle", "elapsed_ms", "total_ms",
+    "cycle_started_ms", "focus_ms", "reviews", "answer_ms_total", "correct", "graded",
+)
+
+EXPORT_SELECT = """
+SELECT e.id, e.ts_ms, e.day, e.profile, e.kind, e.op_mode, e.cycle, e.elapsed_ms, e.total_ms,
+       e.cycle_started_ms, e.focus_ms, r.reviews, r.answer_ms_total, r.correct, r.graded
+FROM events e LEFT JOIN cycle_reviews r ON r.event_id = e.id
+"""
+
+class ExportCancelled(Exception):
+    pass
+
+def _filters(profile, first_day, last_day):
+    clauses = []
+    params = []
+    if profile is not None:
+        clauses.append("e.profile = ?")
+        params.append(profile)
+    if first_day is not None:
+        clauses.append("e.day >= ?")
+        params.append(first_day)
+    if last_day is not None:
+        clauses.append("e.day <= ?")
+        params.append(last_day)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+def count_events(conn, profile=None, first_day=None, last_day=None):
+    where, params = _filters(profile, first_day, last_day)
+    return conn.execute(f"SELECT COUNT(*) FROM events e{where}", params).fetchone()[0]
+
+def iter_events(conn, profile=None, first_day=None, last_day=None, chunk_size=EXPORT_CHUNK):
+    where, params = _filters(profile, first_day, last_day)
+    cursor = conn.execute(f"{EXPORT_SELECT}{where} ORDER BY e.day, e.id", params)
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
+    finally:
+        cursor.close()
+
+def _write_csv(f, chunks):
+    writer = csv.writer(f)
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in chunks:
+        writer.writerows(rows)
+        yield len(rows)
+
+def _write_jsonl(f, chunks):
+    for rows in chunks:
+        f.write("".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, row)), separators=(",", ":")) + "\n" for row in rows
+        ))
+        yield len(rows)
+
+def export_events(conn, path, fmt=FORMAT_CSV, profile=None, first_day=None, last_day=None,
+                  progress=None, cancelled=None):
+    total = count_events(conn, profile, first_day, last_day)
+    chunks = iter_events(conn, profile, first_day, last_day)
+    writer = _write_jsonl if fmt == FORMAT_JSONL else _write_csv
+    done = 0
+    try:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            for written in writer(f, chunks):
+                done += written
+                if progress is not None:
+                    progress(done, total)
+                if cancelled is not None and cancelled():
+                    chunks.close()
+                    raise ExportCancelled()
+    except BaseException:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        raise
+    return done
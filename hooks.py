@@ -0,0 +1,96 @@
+import traceback
+from collections import namedtuple
+from .state import STOPPED
+from .engine import (
+    EVENT_START, EVENT_PAUSE, EVENT_RESUME, EVENT_CYCLE_COMPLETE, EVENT_PHASE, EVENT_STOP
+)
+
+MAX_FAILURES = 3
+
+TimerSnapshot = namedtuple(
+    "TimerSnapshot",
+    "state elapsed_seconds remaining_seconds total_seconds current_cycle cycles phase_index phase_name phase_kind",
+)
+
+class _TimerHook:
+    def __init__(self, name):
+        self.name = name
+        self._hooks = ()
+        self._failures = {}
+        self.failures = 0
+
+    def append(self, callback):
+        if callback not in self._hooks:
+            self._hooks = self._hooks + (callback,)
+
+    def remove(self, callback):
+        if callback in self._hooks:
+            self._hooks = tuple(hook for hook in self._hooks if hook is not callback)
+            self._failures.pop(callback, None)
+
+    def count(self):
+        return len(self._hooks)
+
+    def __call__(self, snapshot):
+        for hook in self._hooks:
+            try:
+                hook(snapshot)
+            except Exception:
+                self.failures += 1
+                failures = self._failures.get(hook, 0) + 1
+                self._failures[hook] = failures
+                traceback.print_exc()
+                if failures >= MAX_FAILURES:
+                    self.remove(hook)
+
+study_timer_did_start = _TimerHook("study_timer_did_start")
+study_timer_did_pause = _TimerHook("study_timer_did_pause")
+study_timer_did_resume = _TimerHook("study_timer_did_resume")
+study_timer_did_complete_cycle = _TimerHook("study_timer_did_complete_cycle")
+study_timer_did_change_phase = _TimerHook("study_timer_did_change_phase")
+study_timer_did_stop = _TimerHook("study_timer_did_stop")
+
+_EVENT_HOOKS = {
+    EVENT_START: study_timer_did_start,
+    EVENT_PAUSE: study_timer_did_pause,
+    EVENT_RESUME: study_timer_did_resume,
+    EVENT_CYCLE_COMPLETE: study_timer_did_complete_cycle,
+    EVENT_PHASE: study_timer_did_change_phase,
+    EVENT_STOP: study_timer_did_stop,
+}
+
+_engine = None
+
+def _build_snapshot(engine, elapsed_seconds=None):
+    phase = engine.phase()
+    if elapsed_seconds is None:
+        elapsed_seconds = engine.elapsed_seconds
+    return TimerSnapshot(
+        engine.state,
+        elapsed_seconds,
+        None if engine.is_stopwatch else engine.display_seconds(),
+        engine.total_seconds,
+        engine.current_cycle,
+        engine.cycles,
+        engine.phase_index if phase is not None else None,
+        phase.name if phase is not None else None,
+        phase.kind if phase is not None else None,
+    )
+
+def _dispatch(kind, engine, elapsed_seconds):
+    hook = _EVENT_HOOKS.get(kind)
+    if hook is None or not hook._hooks:
+        return
+    hook(_build_snapshot(engine, elapsed_seconds))
+
+def attach(engine):
+    global _engine
+    if _engine is not None:
+        _engine.unsubscribe(_dispatch)
+    _engine = engine
+    engine.subscribe(_dispatch)
+
+def current_snapshot():
+    if _engine is None:
+        return TimerSnapshot(STOPPED, 0.0, None, 0, 1, 0, None, None, None)
+    return _build_snapshot(_engine)
@@ -0,0 +1,105 @@
+import json
+import time
+from aqt.qt import QObject, QLocalServer, QLocalSocket
+from .state import STOPPED, RUNNING, PAUSED
+
+SERVER_NAME = "anki-study-timer"
+MAX_CLIENTS = 4
+MAX_PENDING_BYTES = 64 * 1024
+
+STATE_NAMES = {STOPPED: "stopped", RUNNING: "running", PAUSED: "paused"}
+
+def encode_state(kind, engine):
+    phase = engine.phase()
+    message = {
+        'e': kind,
+        's': STATE_NAMES[engine.state],
+        'r': engine.display_seconds(),
+        't': engine.total_seconds,
+        'c': engine.current_cycle,
+        'n': engine.cycles,
+        'ts': int(time.time() * 1000),
+    }
+    if phase is not None:
+        message['p'] = phase.name
+        message['k'] = phase.kind
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+class TimerBroadcastServer(QObject):
+    def __init__(self, engine, name=SERVER_NAME, max_clients=MAX_CLIENTS, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.name = name
+        self.max_clients = max(int(max_clients), 1)
+        self.clients = []
+        self.rejected = 0
+        self.dropped = 0
+        self._server = None
+
+    def is_listening(self):
+        return self._server is not None and self._server.isListening()
+
+    def start(self):
+        if self.is_listening():
+            return True
+        server = QLocalServer(self)
+        server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        server.setMaxPendingConnections(self.max_clients)
+        QLocalServer.removeServer(self.name)
+        if not server.listen(self.name):
+            server.deleteLater()
+            return False
+        server.newConnection.connect(self._accept)
+        self._server = server
+        self.engine.subscribe(self._on_engine_event)
+        return True
+
+    def stop(self):
+        self.engine.unsubscribe(self._on_engine_event)
+        for sock in list(self.clients):
+            sock.disconnectFromServer()
+        self.clients.clear()
+        if self._server is not None:
+            self._server.close()
+            self._server.deleteLater()
+            self._server = None
+
+    def _accept(self):
+        while self._server.hasPendingConnections():
+            sock = self._server.nextPendingConnection()
+            if len(self.clients) >= self.max_clients:
+                self.rejected += 1
+                sock.abort()
+                sock.deleteLater()
+                continue
+            self.clients.append(sock)
+            sock.disconnected.connect(lambda sock=sock: self._drop(sock))
+            sock.readyRead.connect(sock.readAll)
+            sock.write(encode_state("hello", self.engine))
+
+    def _drop(self, sock):
+        if sock in self.clients:
+            self.clients.remove(sock)
+            sock.deleteLater()
+
+    def _on_engine_event(self, kind, engine, elapsed_seconds):
+        if not self.clients:
+            return
+        line = encode_state(kind, engine)
+        for sock in list(self.clients):
+            if sock.state() != QLocalSocket.LocalSocketState.ConnectedState:
+                self._drop(sock)
+            elif sock.bytesToWrite() > MAX_PENDING_BYTES:
+                self.dropped += 1
+                sock.abort()
+                self._drop(sock)
+            else:
+                sock.write(line)
+
+    def stats(self):
+        return {
+            'listening': self.is_listening(),
+            'clients': len(self.clients),
+            'rejected': self.rejected,
+            'dropped': self.dropped,
+        }
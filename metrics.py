@@ -0,0 +1,146 @@
+import time
+from bisect import bisect_left
+
+PAINT_BUCKETS_MS = (0.25, 0.5, 1, 2, 4, 8, 16, 33, 66, 133)
+LATENESS_BUCKETS_MS = (1, 2, 4, 8, 16, 33, 66, 133, 250, 500)
+
+MODE_NAMES = {0: "circular", 1: "focus", 2: "flip", 3: "linear"}
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.reset()
+
+    def reset(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, pct):
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100.0
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self):
+        buckets = {f"<={b}": n for b, n in zip(self.bounds, self.counts)}
+        buckets[f">{self.bounds[-1]}"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+            "buckets": buckets,
+        }
+
+class RateCounter:
+    __slots__ = ("total", "_minute", "_current", "last_minute")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.total = 0
+        self._minute = int(time.monotonic() // 60)
+        self._current = 0
+        self.last_minute = 0
+
+    def hit(self, n=1):
+        minute = int(time.monotonic() // 60)
+        if minute != self._minute:
+            self.last_minute = self._current if minute == self._minute + 1 else 0
+            self._minute = minute
+            self._current = 0
+        self._current += n
+        self.total += n
+
+    def per_minute(self):
+        self.hit(0)
+        return self.last_minute
+
+class Metrics:
+    def __init__(self):
+        self._sources = {}
+        self.reset()
+
+    def reset(self):
+        self.started_at = time.time()
+        self.paint = {name: Histogram(PAINT_BUCKETS_MS) for name in MODE_NAMES.values()}
+        self.tick_lateness = Histogram(LATENESS_BUCKETS_MS)
+        self.tick_wakeups = RateCounter()
+        self.anim_wakeups = RateCounter()
+        self.frames_rendered = 0
+        self.frames_dropped = 0
+
+    def record_paint(self, mode, elapsed_ns):
+        self.paint[MODE_NAMES.get(mode, "circular")].add(elapsed_ns / 1_000_000)
+
+    def record_tick(self, lateness_ms):
+        self.tick_lateness.add(max(lateness_ms, 0.0))
+
+    def record_wakeup(self):
+        self.tick_wakeups.hit()
+
+    def record_animation_frame(self, dropped):
+        self.frames_rendered += 1
+        self.frames_dropped += dropped
+        self.anim_wakeups.hit()
+
+    def register_source(self, name, provider):
+        self._sources[name] = provider
+
+    def unregister_source(self, name):
+        self._sources.pop(name, None)
+
+    def summary_line(self):
+        paint = [h for h in self.paint.values() if h.count]
+        paint_p90 = max((h.percentile(90) for h in paint), default=0.0)
+        return (
+            f"paint p90 ≤{paint_p90:g} ms · "
+            f"quadros {self.frames_rendered}/{self.frames_dropped} perdidos · "
+            f"atraso p90 ≤{self.tick_lateness.percentile(90):g} ms · "
+            f"{self.tick_wakeups.per_minute() + self.anim_wakeups.per_minute()} despertares/min"
+        )
+
+    def snapshot(self):
+        data = {
+            "started_at": self.started_at,
+            "captured_at": time.time(),
+            "paint_ms": {name: h.to_dict() for name, h in self.paint.items()},
+            "tick_lateness_ms": self.tick_lateness.to_dict(),
+            "animation": {
+                "frames_rendered": self.frames_rendered,
+                "frames_dropped": self.frames_dropped,
+            },
+            "wakeups": {
+                "tick_total": self.tick_wakeups.total,
+                "tick_last_minute": self.tick_wakeups.per_minute(),
+                "animation_total": self.anim_wakeups.total,
+                "animation_last_minute": self.anim_wakeups.per_minute(),
+            },
+        }
+        for name, provider in list(self._sources.items()):
+            try:
+                data[name] = provider()
+            except Exception as exc:
+                data[name] = {"error": repr(exc)}
+        return data
+
+metrics = Metrics()
@@ -0,0 +1,180 @@
+from aqt import mw
+from aqt.qt import (
+    QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit, QSpinBox,
+    Qt, pyqtSignal
+)
+from .state import RUNNING
+from .engine import TimerEngine, EVENT_PAUSE, EVENT_CYCLE_COMPLETE, EVENT_STOP
+from .scheduler import TickScheduler
+from .text_cache import time_parts
+from .alert_sound import alert_sound
+
+MAX_NAMED_TIMERS = 8
+
+class NamedTimer:
+    def __init__(self, name, total_seconds, on_change, on_finish=None):
+        self.name = name
+        self._on_change = on_change
+        self._on_finish = on_finish
+        self.engine = TimerEngine()
+        self.engine.configure(total_seconds)
+        self.engine.subscribe(self._on_engine_event)
+        self._scheduler = TickScheduler(self.engine.tick)
+
+    @property
+    def total_seconds(self):
+        return self.engine.total_seconds
+
+    @property
+    def state(self):
+        return self.engine.state
+
+    def display_seconds(self):
+        return self.engine.display_seconds()
+
+    def toggle(self):
+        self.engine.toggle()
+
+    def reset(self):
+        self.engine.stop()
+
+    def _on_engine_event(self, kind, engine, elapsed_seconds):
+        if kind == EVENT_CYCLE_COMPLETE:
+            if self._on_finish is not None:
+                self._on_finish(self)
+            return
+        if kind == EVENT_PAUSE or kind == EVENT_STOP:
+            self._scheduler.cancel()
+        else:
+            deadline_ns = engine.next_deadline_ns()
+            if deadline_ns is not None:
+                self._scheduler.arm_at(deadline_ns)
+        self._on_change(self)
+
+def format_seconds(seconds):
+    h, m, s = time_parts(seconds)
+    if h != "00":
+        return f"{h}:{m}:{s}"
+    return f"{m}:{s}"
+
+class NamedTimerRow(QFrame):
+    removed = pyqtSignal(object)
+
+    def __init__(self, timer, parent=None):
+        super().__init__(parent)
+        self.timer = timer
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+
+        self.name_label = QLabel(timer.name)
+        self.time_label = QLabel()
+        self.time_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+        self.btn_toggle = QPushButton("▶")
+        self.btn_toggle.setFixedSize(22, 22)
+        self.btn_toggle.setFlat(True)
+        self.btn_toggle.clicked.connect(timer.toggle)
+
+        self.btn_reset = QPushButton("↺")
+        self.btn_reset.setFixedSize(22, 22)
+        self.btn_reset.setFlat(True)
+        self.btn_reset.clicked.connect(timer.reset)
+
+        self.btn_remove = QPushButton("✕")
+        self.btn_remove.setFixedSize(22, 22)
+        self.btn_remove.setFlat(True)
+        self.btn_remove.clicked.connect(lambda: self.removed.emit(self))
+
+        layout.addWidget(self.name_label, 1)
+        layout.addWidget(self.time_label)
+        layout.addWidget(self.btn_toggle)
+        layout.addWidget(self.btn_reset)
+        layout.addWidget(self.btn_remove)
+
+        self.refresh()
+
+    def refresh(self):
+        self.time_label.setText(format_seconds(self.timer.display_seconds()))
+        self.btn_toggle.setText("⏸" if self.timer.state == RUNNING else "▶")
+
+class NamedTimersPanel(QFrame):
+    changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.sound_enabled = False
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(2)
+
+        self.rows_layout = QVBoxLayout()
+        self.rows_layout.setSpacing(2)
+        layout.addLayout(self.rows_layout)
+
+        add_layout = QHBoxLayout()
+        self.name_input = QLineEdit()
+        self.name_input.setPlaceholderText("Novo timer")
+        self.minutes_input = QSpinBox()
+        self.minutes_input.setRange(0, 999)
+        self.minutes_input.setSuffix("m")
+        self.minutes_input.setToolTip("0 = Cronômetro")
+        self.btn_add = QPushButton("+")
+        self.btn_add.setFixedSize(22, 22)
+        self.btn_add.clicked.connect(self._add_from_inputs)
+
+        add_layout.addWidget(self.name_input, 1)
+        add_layout.addWidget(self.minutes_input)
+        add_layout.addWidget(self.btn_add)
+        layout.addLayout(add_layout)
+
+    def _default_name(self, minutes):
+        if minutes == 0 and mw.col is not None:
+            return mw.col.decks.current()["name"]
+        return f"Timer {len(self.rows) + 1}"
+
+    def _add_from_inputs(self):
+        minutes = self.minutes_input.value()
+        name = self.name_input.text().strip() or self._default_name(minutes)
+        if self.add_timer(name, minutes * 60):
+            self.name_input.clear()
+            self.changed.emit()
+
+    def add_timer(self, name, total_seconds):
+        if len(self.rows) >= MAX_NAMED_TIMERS:
+            return False
+        timer = NamedTimer(name, total_seconds, self._on_timer_change, self._on_timer_finish)
+        row = NamedTimerRow(timer)
+        row.removed.connect(self._remove_row)
+        self.rows.append(row)
+        self.rows_layout.addWidget(row)
+        self.btn_add.setEnabled(len(self.rows) < MAX_NAMED_TIMERS)
+        return True
+
+    def _remove_row(self, row):
+        row.timer.reset()
+        self.rows.remove(row)
+        row.setParent(None)
+        row.deleteLater()
+        self.btn_add.setEnabled(True)
+        self.changed.emit()
+
+    def _on_timer_change(self, timer):
+        for row in self.rows:
+            if row.timer is timer:
+                row.refresh()
+                return
+
+    def _on_timer_finish(self, timer):
+        if self.sound_enabled:
+            alert_sound().play()
+
+    def to_config(self):
+        return [{'name': row.timer.name, 'seconds': row.timer.total_seconds} for row in self.rows]
+
+    def load_config(self, items):
+        for item in items or []:
+            self.add_timer(item.get('name', ''), int(item.get('seconds', 0)))
@@ -0,0 +1,78 @@
+from collections import namedtuple
+from aqt.qt import QColor, QPen, QBrush, QLinearGradient, QGradient, Qt
+
+DEFAULT_RING_COLOR = QColor(10, 132, 255)
+
+MAX_SHADOW_ALPHA = 180
+
+TimerPalette = namedtuple("TimerPalette", [
+    "is_night",
+    "text",
+    "text_pen",
+    "track_pen",
+    "track_brush",
+    "progress_pen",
+    "bar_brush",
+    "cycle_pen",
+    "card_brush",
+    "card_border_pen",
+    "card_text_pen",
+    "shadow_brushes",
+    "split_pen",
+    "hinge_pen",
+    "hinge_brush",
+])
+
+def _pen(color, width=1.0, cap=None):
+    pen = QPen(color, width)
+    if cap is not None:
+        pen.setCapStyle(cap)
+    return pen
+
+def _card_brush():
+    gradient = QLinearGradient(0, 0, 0, 1)
+    gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectMode)
+    gradient.setColorAt(0.0, QColor(50, 50, 50))
+    gradient.setColorAt(0.48, QColor(30, 30, 30))
+    gradient.setColorAt(0.52, QColor(25, 25, 25))
+    gradient.setColorAt(1.0, QColor(45, 45, 45))
+    return QBrush(gradient)
+
+_SHADOW_BRUSHES = None
+
+def _shadow_brushes():
+    global _SHADOW_BRUSHES
+    if _SHADOW_BRUSHES is None:
+        _SHADOW_BRUSHES = tuple(QBrush(QColor(0, 0, 0, a)) for a in range(MAX_SHADOW_ALPHA + 1))
+    return _SHADOW_BRUSHES
+
+def build_palette(is_night, custom_text=None, custom_ring=None):
+    if custom_text:
+        text = QColor(custom_text)
+    else:
+        text = QColor(255, 255, 255) if is_night else QColor(0, 0, 0)
+
+    ring = QColor(custom_ring) if custom_ring else DEFAULT_RING_COLOR
+
+    track = QColor(80, 80, 80) if is_night else QColor(230, 230, 230)
+    bar_track = QColor(60, 60, 60) if is_night else QColor(220, 220, 220)
+    cycle = QColor(150, 150, 150) if is_night else QColor(100, 100, 100)
+    card_text = QColor(custom_text) if custom_text else QColor(245, 245, 245)
+
+    return TimerPalette(
+        is_night=is_night,
+        text=text,
+        text_pen=_pen(text),
+        track_pen=_pen(track, 2),
+        track_brush=QBrush(bar_track),
+        progress_pen=_pen(ring, 8, Qt.PenCapStyle.RoundCap),
+        bar_brush=QBrush(ring),
+        cycle_pen=_pen(cycle),
+        card_brush=_card_brush(),
+        card_border_pen=_pen(QColor(10, 10, 10), 1.5),
+        card_text_pen=_pen(card_text),
+        shadow_brushes=_shadow_brushes(),
+        split_pen=_pen(QColor(5, 5, 5), 3),
+        hinge_pen=_pen(QColor(5, 5, 5), 1),
+        hinge_brush=QBrush(QColor(20, 20, 20)),
+    )
@@ -0,0 +1,8 @@
+import os
+from aqt import mw
+
+def user_files_dir():
+    addon_dir = mw.addonManager.addonsFolder(__name__.split('.')[0])
+    path = os.path.join(addon_dir, "user_files")
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,90 @@
+from aqt.qt import QObject, pyqtSignal
+
+QUALITY_FULL = 0
+QUALITY_REDUCED_FPS = 1
+QUALITY_NO_ANTIALIAS = 2
+QUALITY_INSTANT = 3
+
+QUALITY_NAMES = ["Alta", "Média (30 fps)", "Baixa (sem suavização)", "Mínima (sem animação)"]
+
+REDUCED_FPS = 30
+
+PAINT_BUDGET_MS = 8.0
+RECOVER_MS = 2.5
+EMA_ALPHA = 0.2
+MIN_SAMPLES_TO_DEGRADE = 8
+SAMPLES_TO_RECOVER = 300
+
+class QualityGovernor(QObject):
+    level_changed = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.enabled = True
+        self.level = QUALITY_FULL
+        self._reset_window()
+
+    def _reset_window(self):
+        self._ema = 0.0
+        self._samples = 0
+        self._calm = 0
+
+    def set_enabled(self, enabled):
+        self.enabled = bool(enabled)
+        if not self.enabled:
+            self._set_level(QUALITY_FULL)
+
+    def record(self, paint_ms):
+        if not self.enabled:
+            return
+        self._samples += 1
+        self._ema = paint_ms if self._samples == 1 else self._ema + EMA_ALPHA * (paint_ms - self._ema)
+
+        if self._ema > PAINT_BUDGET_MS and self._samples >= MIN_SAMPLES_TO_DEGRADE:
+            if self.level < QUALITY_INSTANT:
+                self._set_level(self.level + 1)
+            return
+
+        if self._ema < RECOVER_MS:
+            self._calm += 1
+            if self._calm >= SAMPLES_TO_RECOVER and self.level > QUALITY_FULL:
+                self._set_level(self.level - 1)
+        else:
+            self._calm = 0
+
+    def _set_level(self, level):
+        self._reset_window()
+        if level == self.level:
+            return
+        self.level = level
+        self.level_changed.emit(level)
+
+    def frame_cap(self, requested):
+        if self.level >= QUALITY_REDUCED_FPS:
+            return min(requested, REDUCED_FPS)
+        return requested
+
+    def antialias(self):
+        return self.level < QUALITY_NO_ANTIALIAS
+
+    def animations_enabled(self):
+        return self.level < QUALITY_INSTANT
+
+    def name(self):
+        return QUALITY_NAMES[self.level]
+
+    def stats(self):
+        return {
+            'enabled': self.enabled,
+            'level': self.level,
+            'name': self.name(),
+            'paint_ema_ms': self._ema,
+        }
+
+_governor = None
+
+def quality_governor():
+    global _governor
+    if _governor is None:
+        _governor = QualityGovernor()
+    return _governor
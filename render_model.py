@@ -0,0 +1,153 @@
+import time
+from collections import OrderedDict
+from aqt import mw
+from aqt.qt import QObject
+from .animation import animation_clock
+from .palette import build_palette
+from .text_cache import TextCache, time_parts
+
+MODE_CIRCULAR = 0
+MODE_FOCUS = 1
+MODE_FLIP = 2
+MODE_LINEAR = 3
+
+CARD_CACHE_LIMIT = 192
+
+class TimerRenderModel(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.views = []
+
+        self.progress = 0.0
+        self.display_seconds = 0
+        self.time_parts = time_parts(0)
+        self.display_mode = MODE_CIRCULAR
+
+        self.custom_text_color = None
+        self.custom_ring_color = None
+        self.phase_color = None
+
+        self.show_cycles = False
+        self.current_cycle = 1
+        self.total_cycles = 0
+        self.cycle_label = None
+
+        self.anim_progress = 1.0
+        self.anim_start_ns = 0
+        self.prev_parts = self.time_parts
+        self.curr_parts = self.time_parts
+
+        self.card_cache = OrderedDict()
+        self.text_cache = TextCache()
+        self.colors = build_palette(mw.pm.night_mode())
+
+    def attach(self, view):
+        if view not in self.views:
+            self.views.append(view)
+
+    def detach(self, view):
+        if view in self.views:
+            self.views.remove(view)
+        if self.anim_progress < 1.0 and not self.rendering_views():
+            self._suspend()
+
+    def rendering_views(self):
+        return [view for view in self.views if view.is_rendering()]
+
+    def refresh_theme(self):
+        ring_color = self.phase_color or self.custom_ring_color
+        self.colors = build_palette(mw.pm.night_mode(), self.custom_text_color, ring_color)
+        self.clear_render_cache()
+        for view in self.views:
+            view.theme_changed()
+
+    def clear_render_cache(self):
+        self.card_cache.clear()
+        self.text_cache.clear()
+
+    def set_display_mode(self, mode_index):
+        self.display_mode = mode_index
+        for view in self.views:
+            view.update()
+
+    def set_custom_colors(self, text_col, ring_col):
+        self.custom_text_color = text_col
+        self.custom_ring_color = ring_col
+        self.refresh_theme()
+
+    def set_phase_color(self, color):
+        if color != self.phase_color:
+            self.phase_color = color
+            self.refresh_theme()
+
+    def set_cycle_info(self, active, current, total, label=None):
+        layout_changed = active != self.show_cycles
+        text_changed = active and (current, total, label) != (self.current_cycle, self.total_cycles, self.cycle_label)
+        self.show_cycles = active
+        self.current_cycle = current
+        self.total_cycles = total
+        self.cycle_label = label
+        if layout_changed or text_changed:
+            for view in self.rendering_views():
+                view.cycle_info_changed(layout_changed)
+
+    def update_time(self, progress, seconds_to_show):
+        old_parts = self.time_parts
+        old_progress = self.progress
+
+        self.progress = progress
+        self.display_seconds = seconds_to_show
+        new_parts = self.time_parts = time_parts(seconds_to_show)
+        text_changed = new_parts != old_parts
+        needs_anim = self.display_mode == MODE_FLIP and text_changed
+
+        views = self.rendering_views()
+        if not views:
+            self._suspend()
+            return
+
+        was_animating = self.anim_progress < 1.0
+        clock = animation_clock()
+        if needs_anim and clock.enabled():
+            self.prev_parts = old_parts
+            self.curr_parts = new_parts
+            self.anim_start_ns = time.monotonic_ns()
+            self.anim_progress = 0.0
+            clock.subscribe(self)
+        elif needs_anim or self.anim_progress >= 1.0:
+            self.prev_parts = self.curr_parts = new_parts
+
+        for view in views:
+            view.time_changed(old_parts, new_parts, old_progress, needs_anim, was_animating)
+
+    def _suspend(self):
+        animation_clock().unsubscribe(self)
+        self.anim_progress = 1.0
+        self.prev_parts = self.curr_parts = self.time_parts
+
+    def animation_frame(self, now_ns):
+        views = self.rendering_views()
+        if not views:
+            self._suspend()
+            return
+
+        duration_ms = animation_clock().duration_ms
+        elapsed_ms = (now_ns - self.anim_start_ns) / 1_000_000
+        self.anim_progress = elapsed_ms / duration_ms if duration_ms > 0 else 1.0
+
+        if self.anim_progress >= 1.0:
+            self.finish_animation()
+            return
+
+        for view in views:
+            view.animation_changed()
+
+    def finish_animation(self):
+        animation_clock().unsubscribe(self)
+        self.anim_progress = 1.0
+        self.prev_parts = self.curr_parts
+        for view in self.rendering_views():
+            view.animation_changed()
+
+    def has_hours(self):
+        return self.curr_parts[0] != "00" or self.prev_parts[0] != "00"
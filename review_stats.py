@@ -0,0 +1,112 @@
+from bisect import bisect_right
+from aqt import mw
+from aqt.operations import QueryOp
+from .engine import EVENT_CYCLE_COMPLETE
+from .session_store import session_store
+
+REVIEW_TYPE = 1
+
+PENDING_LIMIT = 500
+BATCH_GAP_MS = 60 * 60 * 1000
+
+def pending_cycles(conn, profile, limit=PENDING_LIMIT):
+    return conn.execute(
+        "SELECT e.id, e.cycle_started_ms, e.ts_ms FROM events e "
+        "LEFT JOIN cycle_reviews r ON r.event_id = e.id "
+        "WHERE e.kind = ? AND e.profile = ? AND r.event_id IS NULL "
+        "ORDER BY e.id DESC LIMIT ?",
+        (EVENT_CYCLE_COMPLETE, profile, limit),
+    ).fetchall()
+
+def save_annotations(conn, rows):
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO cycle_reviews (event_id, reviews, answer_ms_total, correct, graded) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+
+def _group_windows(windows):
+    groups = []
+    for window in sorted(windows, key=lambda w: w[1]):
+        if groups and window[1] - groups[-1][-1][2] <= BATCH_GAP_MS:
+            groups[-1].append(window)
+        else:
+            groups.append([window])
+    return groups
+
+def query_revlog(db, windows):
+    results = []
+    for group in _group_windows(windows):
+        starts = [start for _, start, _ in group]
+        totals = {event_id: [0, 0, 0, 0] for event_id, _, _ in group}
+
+        rows = db.all(
+            "SELECT id, time, ease, type FROM revlog WHERE id BETWEEN ? AND ? AND ease > 0",
+            group[0][1], max(end for _, _, end in group),
+        )
+        for rev_id, answer_ms, ease, rev_type in rows:
+            index = bisect_right(starts, rev_id) - 1
+            if index < 0:
+                continue
+            event_id, _, end = group[index]
+            if rev_id > end:
+                continue
+            entry = totals[event_id]
+            entry[0] += 1
+            entry[1] += answer_ms
+            if rev_type == REVIEW_TYPE:
+                entry[3] += 1
+                if ease > 1:
+                    entry[2] += 1
+
+        results.extend((event_id, *entry) for event_id, entry in totals.items())
+    return results
+
+_pending = False
+
+def annotate_cycles(on_done=None):
+    global _pending
+    if _pending or mw.col is None:
+        if on_done:
+            on_done()
+        return
+    _pending = True
+
+    store = session_store()
+    store.flush()
+    profile = mw.pm.name or ""
+
+    def finish():
+        global _pending
+        _pending = False
+        if on_done:
+            on_done()
+
+    def on_pending(future):
+        windows = None if future.exception() else future.result()
+        if not windows:
+            mw.taskman.run_on_main(finish)
+            return
+        mw.taskman.run_on_main(lambda: _query(windows))
+
+    def _query(windows):
+        if mw.col is None:
+            finish()
+            return
+        QueryOp(
+            parent=mw,
+            op=lambda col: query_revlog(col.db, windows),
+            success=_save,
+        ).failure(lambda exc: finish()).run_in_background()
+
+    def _save(results):
+        future = store.submit(save_annotations, results)
+        future.add_done_callback(lambda _: mw.taskman.run_on_main(finish))
+
+    store.submit(pending_cycles, profile).add_done_callback(on_pending)
+
+def retention(correct, graded):
+    if not graded:
+        return None
+    return correct / graded
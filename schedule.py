@@ -0,0 +1,81 @@
+import bisect
+import itertools
+from collections import namedtuple
+
+PHASE_WORK = "work"
+PHASE_BREAK = "break"
+PHASE_LONG_BREAK = "long_break"
+
+PHASE_NAMES = {
+    PHASE_WORK: "Foco",
+    PHASE_BREAK: "Pausa",
+    PHASE_LONG_BREAK: "Pausa longa",
+}
+
+DEFAULT_POMODORO = {
+    'work_minutes': 25,
+    'break_minutes': 5,
+    'long_break_minutes': 15,
+    'rounds': 4,
+}
+
+Phase = namedtuple("Phase", "name kind seconds color sound appearance")
+
+def make_phase(kind, seconds, name=None, color=None, sound=None, appearance=None):
+    return Phase(name or PHASE_NAMES.get(kind, kind), kind, int(seconds), color, sound, appearance)
+
+class Schedule:
+    def __init__(self, phases):
+        self.phases = tuple(p for p in phases if p.seconds > 0)
+        self.ends = list(itertools.accumulate(p.seconds for p in self.phases))
+        self.starts = [0] + self.ends[:-1]
+        self.total_seconds = self.ends[-1] if self.ends else 0
+        self.work_ends = list(itertools.accumulate(p.seconds if p.kind == PHASE_WORK else 0 for p in self.phases))
+
+    def __len__(self):
+        return len(self.phases)
+
+    def index_at(self, elapsed_seconds):
+        return min(bisect.bisect_right(self.ends, elapsed_seconds), len(self.phases) - 1)
+
+    def bounds(self, index):
+        return self.starts[index], self.ends[index]
+
+    def work_seconds_at(self, elapsed_seconds):
+        if not self.phases or elapsed_seconds <= 0:
+            return 0
+        if elapsed_seconds >= self.total_seconds:
+            return self.work_ends[-1]
+        index = self.index_at(elapsed_seconds)
+        if self.phases[index].kind != PHASE_WORK:
+            return self.work_ends[index]
+        return self.work_ends[index] - self.ends[index] + elapsed_seconds
+
+def pomodoro(work_minutes=25, break_minutes=5, long_break_minutes=15, rounds=4):
+    rounds = max(int(rounds), 1)
+    phases = []
+    for i in range(rounds):
+        phases.append(make_phase(PHASE_WORK, work_minutes * 60))
+        if i < rounds - 1:
+            phases.append(make_phase(PHASE_BREAK, break_minutes * 60))
+    phases.append(make_phase(PHASE_LONG_BREAK, long_break_minutes * 60))
+    return Schedule(phases)
+
+def schedule_from_config(config):
+    config = config or {}
+    items = config.get('phases')
+    if items:
+        schedule = Schedule(
+            make_phase(
+                item.get('kind', PHASE_WORK), item.get('seconds', item.get('minutes', 0) * 60),
+                item.get('name'), item.get('color'), item.get('sound'), item.get('appearance'),
+            )
+            for item in items
+        )
+    else:
+        values = dict(DEFAULT_POMODORO)
+        values.update({k: config[k] for k in DEFAULT_POMODORO if k in config})
+        schedule = pomodoro(**values)
+    if not schedule:
+        return pomodoro(**DEFAULT_POMODORO)
+    return schedule
@@ -0,0 +1,129 @@
+import heapq
+import itertools
+import math
+import time
+from aqt.qt import QObject, QTimer, Qt
+from .metrics import metrics
+from .engine import NS_PER_SEC, NS_PER_MS
+
+TICK_GUARD_MS = 3
+COALESCE_MS = 40
+
+class DeadlineScheduler(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._heap = []
+        self._seq = itertools.count()
+        self._armed_ns = None
+        self.wakeups = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._fire)
+
+    def __len__(self):
+        return sum(1 for entry in self._heap if entry[2] is not None)
+
+    def schedule(self, deadline_ns, callback):
+        entry = [deadline_ns, next(self._seq), callback]
+        heapq.heappush(self._heap, entry)
+        if self._armed_ns is None or deadline_ns < self._armed_ns:
+            self._rearm()
+        return entry
+
+    def cancel(self, entry):
+        if entry is not None:
+            entry[2] = None
+
+    def _rearm(self):
+        heap = self._heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+        if not heap:
+            self._armed_ns = None
+            self._timer.stop()
+            return
+
+        target_ns = heap[0][0]
+        self._armed_ns = target_ns
+        delay_ms = max(math.ceil((target_ns - time.monotonic_ns()) / NS_PER_MS), 0) + TICK_GUARD_MS
+        self._timer.start(delay_ms)
+
+    def _fire(self):
+        now_ns = time.monotonic_ns()
+        self._armed_ns = None
+        self.wakeups += 1
+        metrics.record_wakeup()
+
+        due = []
+        heap = self._heap
+        window_end = now_ns + COALESCE_MS * NS_PER_MS
+        while heap and heap[0][0] <= window_end:
+            deadline_ns, _, callback = heapq.heappop(heap)
+            if callback is not None:
+                due.append((deadline_ns, callback))
+
+        for deadline_ns, callback in due:
+            callback(now_ns, deadline_ns)
+
+        if self._armed_ns is None:
+            self._rearm()
+
+_scheduler = None
+
+def deadline_scheduler():
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = DeadlineScheduler()
+    return _scheduler
+
+class TickScheduler:
+    def __init__(self, callback, scheduler=None, record_lateness=False):
+        self._callback = callback
+        self._record_lateness = record_lateness
+        self._scheduler = scheduler or deadline_scheduler()
+        self._entry = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.wakeups = 0
+        self.last_drift_ms = 0.0
+        self.max_drift_ms = 0.0
+        self._drift_total_ms = 0.0
+        self._armed_since_ns = time.monotonic_ns()
+
+    def is_armed(self):
+        return self._entry is not None
+
+    def arm_at(self, deadline_ns):
+        self._scheduler.cancel(self._entry)
+        self._entry = self._scheduler.schedule(deadline_ns, self._fire)
+
+    def cancel(self):
+        self._scheduler.cancel(self._entry)
+        self._entry = None
+
+    def _fire(self, now_ns, deadline_ns):
+        self._entry = None
+        self.wakeups += 1
+        drift_ms = (now_ns - deadline_ns) / NS_PER_MS
+        self.last_drift_ms = drift_ms
+        self.max_drift_ms = max(self.max_drift_ms, abs(drift_ms))
+        self._drift_total_ms += abs(drift_ms)
+        if self._record_lateness:
+            metrics.record_tick(drift_ms)
+
+        self._callback(max(now_ns, deadline_ns))
+
+    def stats(self):
+        window_s = max((time.monotonic_ns() - self._armed_since_ns) / NS_PER_SEC, 1e-9)
+        return {
+            'wakeups': self.wakeups,
+            'wakeups_per_minute': self.wakeups * 60.0 / window_s,
+            'last_drift_ms': self.last_drift_ms,
+            'max_drift_ms': self.max_drift_ms,
+            'mean_drift_ms': self._drift_total_ms / self.wakeups if self.wakeups else 0.0,
+            'shared_wakeups': self._scheduler.wakeups,
+            'pending_deadlines': len(self._scheduler),
+        }
@@ -0,0 +1,257 @@
+import datetime
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from aqt import mw, gui_hooks
+from aqt.qt import QObject, QTimer
+from .engine import EVENT_CYCLE_COMPLETE, EVENT_STOP
+from .paths import user_files_dir
+
+DB_NAME = "sessions.db"
+
+FLUSH_INTERVAL_MS = 5000
+FLUSH_BATCH_SIZE = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    ts_ms INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    op_mode INTEGER NOT NULL,
+    cycle INTEGER NOT NULL,
+    elapsed_ms INTEGER NOT NULL,
+    total_ms INTEGER NOT NULL,
+    cycle_started_ms INTEGER NOT NULL,
+    focus_ms INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_day ON events (day);
+CREATE INDEX IF NOT EXISTS idx_events_profile_day ON events (profile, day);
+CREATE INDEX IF NOT EXISTS idx_events_profile_kind ON events (profile, kind);
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    profile TEXT NOT NULL,
+    day TEXT NOT NULL,
+    focus_ms INTEGER NOT NULL DEFAULT 0,
+    cycles INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (profile, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS weekly_rollup (
+    profile TEXT NOT NULL,
+    week TEXT NOT NULL,
+    focus_ms INTEGER NOT NULL DEFAULT 0,
+    cycles INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (profile, week)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cycle_reviews (
+    event_id INTEGER PRIMARY KEY,
+    reviews INTEGER NOT NULL,
+    answer_ms_total INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    graded INTEGER NOT NULL
+);
+"""
+
+SCHEMA_VERSION = 1
+
+UPSERT_DAILY = """
+INSERT INTO daily_rollup (profile, day, focus_ms, cycles) VALUES (?, ?, ?, ?)
+ON CONFLICT (profile, day) DO UPDATE SET
+    focus_ms = focus_ms + excluded.focus_ms,
+    cycles = cycles + excluded.cycles
+"""
+
+UPSERT_WEEKLY = """
+INSERT INTO weekly_rollup (profile, week, focus_ms, cycles) VALUES (?, ?, ?, ?)
+ON CONFLICT (profile, week) DO UPDATE SET
+    focus_ms = focus_ms + excluded.focus_ms,
+    cycles = cycles + excluded.cycles
+"""
+
+ROLLUP_KINDS = (EVENT_CYCLE_COMPLETE, EVENT_STOP)
+
+INSERT_EVENT = """
+INSERT INTO events (ts_ms, day, profile, kind, op_mode, cycle, elapsed_ms, total_ms, cycle_started_ms, focus_ms)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+def local_day(ts_ms):
+    return time.strftime("%Y-%m-%d", time.localtime(ts_ms / 1000))
+
+def week_of(day):
+    year, week, _ = datetime.date.fromisoformat(day).isocalendar()
+    return f"{year}-W{week:02d}"
+
+def _rollup_rows(events):
+    daily = {}
+    for _, day, profile, kind, _, _, _, _, _, focus_ms in events:
+        if kind not in ROLLUP_KINDS:
+            continue
+        focus, cycles = daily.get((profile, day), (0, 0))
+        daily[(profile, day)] = (focus + focus_ms, cycles + (kind == EVENT_CYCLE_COMPLETE))
+
+    weekly = {}
+    for (profile, day), (focus, cycles) in daily.items():
+        key = (profile, week_of(day))
+        old_focus, old_cycles = weekly.get(key, (0, 0))
+        weekly[key] = (old_focus + focus, old_cycles + cycles)
+
+    return (
+        [(p, d, f, c) for (p, d), (f, c) in daily.items()],
+        [(p, w, f, c) for (p, w), (f, c) in weekly.items()],
+    )
+
+class SessionStore(QObject):
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._buffer = []
+        self._conn = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="study-timer-store")
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FLUSH_INTERVAL_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def record(self, kind, op_mode, cycle, elapsed_seconds, total_seconds, cycle_started_ms, focus_seconds=0,
+               ts_ms=None):
+        if ts_ms is None:
+            ts_ms = int(time.time() * 1000)
+        profile = mw.pm.name if mw.pm else ""
+        self._buffer.append((
+            ts_ms, local_day(ts_ms), profile or "", kind, int(op_mode), int(cycle),
+            int(elapsed_seconds * 1000), int(total_seconds * 1000), int(cycle_started_ms),
+            int(focus_seconds * 1000),
+        ))
+
+        if len(self._buffer) >= FLUSH_BATCH_SIZE:
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self, wait=False):
+        self._timer.stop()
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            future = self._executor.submit(self._write_batch, batch)
+        else:
+            future = self._executor.submit(lambda: None)
+        if wait:
+            future.result()
+        return future
+
+    def submit(self, fn, *args):
+        return self._executor.submit(self._run, fn, args)
+
+    def close(self):
+        self.flush(wait=True)
+        self._executor.submit(self._close_connection).result()
+
+    def _run(self, fn, args):
+        return fn(self._connection(), *args)
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+            self._upgrade(self._conn)
+        return self._conn
+
+    def _upgrade(self, conn):
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        with conn:
+            conn.execute("DELETE FROM daily_rollup")
+            conn.execute("DELETE FROM weekly_rollup")
+            cursor = conn.execute(
+                "SELECT ts_ms, day, profile, kind, op_mode, cycle, elapsed_ms, total_ms, cycle_started_ms, focus_ms "
+                "FROM events WHERE kind IN (?, ?) ORDER BY id", ROLLUP_KINDS
+            )
+            while True:
+                rows = cursor.fetchmany(5000)
+                if not rows:
+                    break
+                self._apply_rollups(conn, rows)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _apply_rollups(self, conn, events):
+        daily, weekly = _rollup_rows(events)
+        conn.executemany(UPSERT_DAILY, daily)
+        conn.executemany(UPSERT_WEEKLY, weekly)
+
+    def _write_batch(self, batch):
+        conn = self._connection()
+        with conn:
+            conn.executemany(INSERT_EVENT, batch)
+            self._apply_rollups(conn, batch)
+
+    def _close_connection(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+_store = None
+
+def session_store():
+    global _store
+    if _store is None:
+        _store = SessionStore(os.path.join(user_files_dir(), DB_NAME))
+        gui_hooks.profile_will_close.append(lambda: _store.flush(wait=True))
+    return _store
+
+def load_stats(conn, profile, today, days=14, weeks=8, recent_cycles=20):
+    first_day = (datetime.date.fromisoformat(today) - datetime.timedelta(days=days - 1)).isoformat()
+    daily = conn.execute(
+        "SELECT day, focus_ms, cycles FROM daily_rollup WHERE profile = ? AND day >= ? ORDER BY day DESC",
+        (profile, first_day),
+    ).fetchall()
+    weekly = conn.execute(
+        "SELECT week, focus_ms, cycles FROM weekly_rollup WHERE profile = ? ORDER BY week DESC LIMIT ?",
+        (profile, weeks),
+    ).fetchall()
+    total_focus, total_cycles = conn.execute(
+        "SELECT COALESCE(SUM(focus_ms), 0), COALESCE(SUM(cycles), 0) FROM daily_rollup WHERE profile = ?",
+        (profile,),
+    ).fetchone()
+
+    active_days = [row[0] for row in conn.execute(
+        "SELECT day FROM daily_rollup WHERE profile = ? AND focus_ms > 0 ORDER BY day", (profile,)
+    )]
+    current_streak, best_streak = _streaks(active_days, today)
+
+    cycles = conn.execute(
+        "SELECT e.ts_ms, e.total_ms, r.reviews, r.answer_ms_total, r.correct, r.graded "
+        "FROM events e LEFT JOIN cycle_reviews r ON r.event_id = e.id "
+        "WHERE e.profile = ? AND e.kind = ? ORDER BY e.id DESC LIMIT ?",
+        (profile, EVENT_CYCLE_COMPLETE, recent_cycles),
+    ).fetchall()
+
+    return {
+        "daily": daily,
+        "weekly": weekly,
+        "total_focus_ms": total_focus,
+        "total_cycles": total_cycles,
+        "current_streak": current_streak,
+        "best_streak": best_streak,
+        "cycles": cycles,
+    }
+
+def _streaks(active_days, today):
+    best = run = 0
+    previous = None
+    for day in active_days:
+        date = datetime.date.fromisoformat(day)
+        run = run + 1 if previous is not None and (date - previous).days == 1 else 1
+        best = max(best, run)
+        previous = date
+
+    current = 0
+    if previous is not None and (datetime.date.fromisoformat(today) - previous).days <= 1:
+        current = run
+    return current, best
@@ -0,0 +1,44 @@
+import json
+import os
+import time
+from aqt import mw
+from .paths import user_files_dir
+
+SNAPSHOT_NAME = "timer_state.json"
+SNAPSHOT_INTERVAL_MS = 15000
+SNAPSHOT_VERSION = 1
+
+def snapshot_path():
+    return os.path.join(user_files_dir(), SNAPSHOT_NAME)
+
+def _profile():
+    return mw.pm.name if mw.pm else ""
+
+def save_snapshot(data):
+    payload = dict(data, version=SNAPSHOT_VERSION, profile=_profile(), saved_ms=int(time.time() * 1000))
+    path = snapshot_path()
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def load_snapshot():
+    try:
+        with open(snapshot_path(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get('version') != SNAPSHOT_VERSION:
+        return None
+    if data.get('profile') != _profile():
+        return None
+    return data
+
+def clear_snapshot():
+    try:
+        os.remove(snapshot_path())
+    except OSError:
+        pass
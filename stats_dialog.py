@@ -0,0 +1,111 @@
+import time
+from aqt import mw
+from aqt.qt import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView, Qt
+)
+from .session_store import session_store, load_stats, local_day
+from .review_stats import annotate_cycles, retention
+
+def format_minutes(ms):
+    minutes = int(ms // 60000)
+    if minutes >= 60:
+        return f"{minutes // 60}h {minutes % 60:02d}m"
+    return f"{minutes}m"
+
+class StatsDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Estatísticas do Timer de Estudo")
+        self.setMinimumSize(420, 480)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        layout = QVBoxLayout(self)
+
+        self.summary_label = QLabel("Carregando…")
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+
+        tables_layout = QHBoxLayout()
+        self.daily_table = self._make_table(["Dia", "Foco", "Ciclos"])
+        self.weekly_table = self._make_table(["Semana", "Foco", "Ciclos"])
+        tables_layout.addWidget(self.daily_table)
+        tables_layout.addWidget(self.weekly_table)
+        layout.addLayout(tables_layout)
+
+        layout.addWidget(QLabel("Ciclos recentes"))
+        self.cycles_table = self._make_table(["Fim", "Duração", "Revisões", "Tempo médio", "Retenção"])
+        layout.addWidget(self.cycles_table)
+
+        self._closed = False
+        self._load()
+        annotate_cycles(on_done=self._reload)
+
+    def _reload(self):
+        if not self._closed:
+            self._load()
+
+    def done(self, result):
+        self._closed = True
+        super().done(result)
+
+    def _make_table(self, headers):
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        return table
+
+    def _load(self):
+        store = session_store()
+        store.flush()
+        profile = mw.pm.name or ""
+        today = local_day(int(time.time() * 1000))
+        future = store.submit(load_stats, profile, today)
+        future.add_done_callback(lambda fut: mw.taskman.run_on_main(lambda: self._show(fut)))
+
+    def _show(self, future):
+        if self._closed:
+            return
+        try:
+            stats = future.result()
+        except Exception as exc:
+            self.summary_label.setText(f"Não foi possível carregar o histórico: {exc}")
+            return
+
+        today = stats["daily"][0] if stats["daily"] else None
+        today_ms = today[1] if today and today[0] == local_day(int(time.time() * 1000)) else 0
+
+        self.summary_label.setText(
+            f"Hoje: <b>{format_minutes(today_ms)}</b> · "
+            f"Total: <b>{format_minutes(stats['total_focus_ms'])}</b> em {stats['total_cycles']} ciclos<br>"
+            f"Sequência atual: <b>{stats['current_streak']}</b> dias · "
+            f"Melhor sequência: <b>{stats['best_streak']}</b> dias"
+        )
+        self._fill(self.daily_table, stats["daily"])
+        self._fill(self.weekly_table, stats["weekly"])
+        self._fill_cycles(stats["cycles"])
+
+    def _fill(self, table, rows):
+        table.setRowCount(len(rows))
+        for i, (label, focus_ms, cycles) in enumerate(rows):
+            table.setItem(i, 0, QTableWidgetItem(label))
+            table.setItem(i, 1, QTableWidgetItem(format_minutes(focus_ms)))
+            table.setItem(i, 2, QTableWidgetItem(str(cycles)))
+
+    def _fill_cycles(self, rows):
+        self.cycles_table.setRowCount(len(rows))
+        for i, (ts_ms, total_ms, reviews, answer_ms, correct, graded) in enumerate(rows):
+            ended = time.strftime("%d/%m %H:%M", time.localtime(ts_ms / 1000))
+            if reviews is None:
+                values = [ended, format_minutes(total_ms), "…", "…", "…"]
+            else:
+                avg = f"{answer_ms / reviews / 1000:.1f}s" if reviews else "-"
+                ratio = retention(correct, graded)
+                values = [
+                    ended, format_minutes(total_ms), str(reviews), avg,
+                    f"{ratio:.0%}" if ratio is not None else "-",
+                ]
+            for col, value in enumerate(values):
+                self.cycles_table.setItem(i, col, QTableWidgetItem(value))
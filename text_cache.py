@@ -0,0 +1,71 @@
+from aqt.qt import QFont, QStaticText, QTransform, QPointF, Qt
+
+TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+SEPARATOR = ":"
+
+STATIC_TEXT_LIMIT = 512
+
+def two_digits(value):
+    if 0 <= value < 100:
+        return TWO_DIGITS[value]
+    return f"{value:02d}"
+
+def time_parts(total_seconds):
+    hours, remainder = divmod(int(total_seconds), 3600)
+    mins, secs = divmod(remainder, 60)
+    return two_digits(hours), TWO_DIGITS[mins], TWO_DIGITS[secs]
+
+class TextCache:
+    def __init__(self):
+        self._fonts = {}
+        self._static = {}
+
+    def clear(self):
+        self._fonts.clear()
+        self._static.clear()
+
+    def font(self, base, bold=True, point_size=None, pixel_size=None, family=None):
+        key = (base.key(), bold, point_size, pixel_size, family)
+        font = self._fonts.get(key)
+        if font is None:
+            font = QFont(base)
+            if family:
+                font.setFamily(family)
+            font.setBold(bold)
+            if point_size is not None:
+                font.setPointSize(point_size)
+            if pixel_size is not None:
+                font.setPixelSize(pixel_size)
+            self._fonts[key] = font
+            self._prepare_digits(font)
+        return font
+
+    def _prepare_digits(self, font):
+        for text in TWO_DIGITS[:60]:
+            self.static_text(text, font)
+        self.static_text(SEPARATOR, font)
+
+    def static_text(self, text, font):
+        key = (text, font.key())
+        static = self._static.get(key)
+        if static is None:
+            if len(self._static) >= STATIC_TEXT_LIMIT:
+                self._static.clear()
+            static = QStaticText(text)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            static.prepare(QTransform(), font)
+            self._static[key] = static
+        return static
+
+    def draw_parts(self, painter, rect, parts, font, align_top=False):
+        statics = [self.static_text(part, font) for part in parts]
+        width = sum(static.size().width() for static in statics)
+        height = max(static.size().height() for static in statics)
+
+        x = rect.center().x() - width / 2
+        y = rect.top() if align_top else rect.center().y() - height / 2
+
+        painter.setFont(font)
+        for static in statics:
+            painter.drawStaticText(QPointF(x, y), static)
+            x += static.size().width()
@@ -1,411 +1,36 @@
-import time
-import math
 from aqt import mw, gui_hooks
 from aqt.qt import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QSpinBox, QLabel, QTimer, QPainter, QColor, 
-    QRectF, Qt, QPen, QDockWidget, QCheckBox, QComboBox, 
-    QFrame, QApplication, QFont, QPointF, QLinearGradient, QRect,
-    QColorDialog
+    QSpinBox, QLabel, QTimer, QColor, 
+    Qt, QDockWidget, QCheckBox, QComboBox, 
+    QFrame, QColorDialog, QFileDialog
 )
-from .state import STOPPED, RUNNING, PAUSED
-
-MODE_CIRCULAR = 0
-MODE_FOCUS = 1
-MODE_FLIP = 2
-MODE_LINEAR = 3 
+from .state import STOPPED, RUNNING
+from .engine import (
+    TimerEngine, EVENT_START, EVENT_PAUSE, EVENT_CYCLE_COMPLETE, EVENT_STOP, EVENT_TICK, EVENT_CYCLE, EVENT_PHASE
+)
+from .schedule import schedule_from_config
+from . import hooks
+from .config_store import ConfigStore
+from .scheduler import TickScheduler
+from .animation import animation_clock, ANIMATION_DURATION, FRAME_CAP, FRAME_CAP_OPTIONS
+from .render_model import TimerRenderModel
+from .display_widget import TimerDisplayWidget
+from .timer_views import MiniTimerOverlay, FullscreenTimerView
+from .metrics import metrics
+from .quality import quality_governor
+from .alert_sound import alert_sound, DEFAULT_VOLUME
+from .named_timers import NamedTimersPanel
+from .ipc import TimerBroadcastServer, SERVER_NAME, MAX_CLIENTS
+from .snapshot import save_snapshot, clear_snapshot, SNAPSHOT_INTERVAL_MS
+from .review_stats import annotate_cycles
+from .session_store import session_store
 
 OP_MODE_TIMER = 0      
 OP_MODE_STOPWATCH = 1  
+OP_MODE_SCHEDULE = 2
 
-ANIMATION_DURATION = 800
-FRAME_RATE = 16 
-
-class TimerDisplayWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.progress = 0.0
-        self.display_seconds = 0
-        self.display_mode = MODE_CIRCULAR
-        self.setMinimumHeight(180)
-        
-        self.custom_text_color = None
-        self.custom_ring_color = None
-
-        self.show_cycles = False
-        self.current_cycle = 1
-        self.total_cycles = 0 
-
-        self.anim_timer = QTimer(self)
-        self.anim_timer.timeout.connect(self._anim_tick)
-        self.anim_progress = 1.0 
-        self.anim_start_time = 0.0
-        
-        self.prev_h = "00"
-        self.prev_m = "00"
-        self.prev_s = "00"
-        
-        self.curr_h = "00"
-        self.curr_m = "00"
-        self.curr_s = "00"
-
-    def set_display_mode(self, mode_index):
-        self.display_mode = mode_index
-        self.update()
-        
-    def set_custom_colors(self, text_col, ring_col):
-        self.custom_text_color = text_col
-        self.custom_ring_color = ring_col
-        self.update()
-
-    def set_cycle_info(self, active, current, total):
-        self.show_cycles = active
-        self.current_cycle = current
-        self.total_cycles = total
-        self.update()
-
-    def update_time(self, progress, seconds_to_show):
-        old_h, old_m, old_s = self._get_time_parts(math.floor(self.display_seconds))
-        
-        self.progress = progress
-        self.display_seconds = seconds_to_show
-        
-        new_h, new_m, new_s = self._get_time_parts(self.display_seconds)
-        
-        needs_anim = False
-        if self.display_mode == MODE_FLIP:
-            if new_s != old_s or new_m != old_m or new_h != old_h:
-                needs_anim = True
-
-        if needs_anim:
-            self.prev_h, self.prev_m, self.prev_s = old_h, old_m, old_s
-            self.curr_h, self.curr_m, self.curr_s = new_h, new_m, new_s
-            
-            self.anim_start_time = time.time()
-            self.anim_progress = 0.0
-            
-            if not self.anim_timer.isActive():
-                self.anim_timer.start(FRAME_RATE)
-        else:
-            if self.anim_progress >= 1.0:
-                self.curr_h, self.curr_m, self.curr_s = new_h, new_m, new_s
-                self.prev_h, self.prev_m, self.prev_s = new_h, new_m, new_s
-            self.update()
-
-    def _anim_tick(self):
-        now = time.time()
-        elapsed_ms = (now - self.anim_start_time) * 1000
-        self.anim_progress = elapsed_ms / ANIMATION_DURATION
-        
-        if self.anim_progress >= 1.0:
-            self.anim_progress = 1.0
-            self.anim_timer.stop()
-            self.prev_h, self.prev_m, self.prev_s = self.curr_h, self.curr_m, self.curr_s
-        
-        self.update()
-
-    def _get_time_parts(self, total_seconds):
-        val = int(total_seconds)
-        hours, remainder = divmod(val, 3600)
-        mins, secs = divmod(remainder, 60)
-        return f"{hours:02d}", f"{mins:02d}", f"{secs:02d}"
-
-    def _get_formatted_text(self):
-        h_str, m_str, s_str = self._get_time_parts(self.display_seconds)
-        if int(h_str) > 0:
-            return f"{h_str}:{m_str}:{s_str}"
-        return f"{m_str}:{s_str}"
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        if self.display_mode == MODE_FLIP:
-            self._draw_flip_style(painter)
-        elif self.display_mode == MODE_LINEAR:
-            self._draw_linear_style(painter)
-        else:
-            self._draw_standard_modes(painter)
-
-        if self.show_cycles:
-            self._draw_cycle_counter(painter)
-
-    def _draw_standard_modes(self, painter):
-        is_night = mw.pm.night_mode()
-        
-        if self.custom_text_color:
-            primary_color = self.custom_text_color
-        else:
-            primary_color = QColor(255, 255, 255) if is_night else QColor(0, 0, 0)
-            
-        track_color = QColor(80, 80, 80) if is_night else QColor(230, 230, 230)
-        
-        rect = self.rect()
-        center_x = rect.center().x()
-        center_y = rect.center().y()
-        if self.show_cycles:
-            center_y -= 15
-
-        text_full = self._get_formatted_text()
-
-        if self.display_mode == MODE_CIRCULAR:
-            avail_height = rect.height() - (30 if self.show_cycles else 0)
-            size = min(rect.width(), avail_height) - 40
-            
-            circ_rect = QRectF(center_x - size/2, center_y - size/2, size, size)
-
-            painter.setPen(QPen(track_color, 2))
-            painter.drawEllipse(circ_rect)
-
-            if self.progress > 0:
-                if self.custom_ring_color:
-                    prog_color = self.custom_ring_color
-                else:
-                    prog_color = QColor(10, 132, 255)
-
-                pen = QPen(prog_color, 8)
-                pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-                painter.setPen(pen)
-                span_angle = int(-360 * self.progress * 16)
-                painter.drawArc(circ_rect, 90 * 16, span_angle)
-
-        painter.setPen(primary_color) 
-        font = painter.font()
-        font.setBold(True)
-        
-        base_size = 60 if self.display_mode == MODE_FOCUS else 28
-        if len(text_full) > 5: 
-            base_size = int(base_size * 0.75)
-            
-        font.setPointSize(base_size)
-        painter.setFont(font)
-        
-        text_rect = QRectF(0, center_y - 50, rect.width(), 100)
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, text_full)
-
-    def _draw_linear_style(self, painter):
-        is_night = mw.pm.night_mode()
-        
-        if self.custom_text_color:
-            text_color = self.custom_text_color
-        else:
-            text_color = QColor(255, 255, 255) if is_night else QColor(0, 0, 0)
-            
-        track_bg = QColor(60, 60, 60) if is_night else QColor(220, 220, 220)
-        
-        if self.custom_ring_color:
-            bar_color = self.custom_ring_color
-        else:
-            bar_color = QColor(10, 132, 255) 
-
-        rect = self.rect()
-        
-        bar_height = 12
-        bar_margin = 20
-        bar_y = 15 
-        
-        track_rect = QRectF(bar_margin, bar_y, rect.width() - (bar_margin*2), bar_height)
-        
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(track_bg)
-        painter.drawRoundedRect(track_rect, bar_height/2, bar_height/2)
-        
-        if self.progress > 0:
-            fill_width = track_rect.width() * self.progress
-            fill_width = max(fill_width, bar_height) 
-            
-            fill_rect = QRectF(track_rect.x(), track_rect.y(), fill_width, track_rect.height())
-            painter.setBrush(bar_color)
-            painter.drawRoundedRect(fill_rect, bar_height/2, bar_height/2)
-
-        text_full = self._get_formatted_text()
-        
-        painter.setPen(text_color)
-        font = painter.font()
-        font.setBold(True)
-        font.setPointSize(48 if len(text_full) <= 5 else 36) 
-        painter.setFont(font)
-        
-        text_y_pos = bar_y + bar_height + 20
-        text_rect = QRectF(0, text_y_pos, rect.width(), rect.height() - text_y_pos)
-        
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, text_full)
-
-    def _draw_cycle_counter(self, painter):
-        is_night = mw.pm.night_mode()
-        text_color = QColor(150, 150, 150) if is_night else QColor(100, 100, 100)
-        
-        rect = self.rect()
-        font = painter.font()
-        font.setBold(False)
-        font.setPointSize(10)
-        painter.setFont(font)
-        painter.setPen(text_color)
-        
-        if self.total_cycles > 0:
-            text = f"Ciclo: {self.current_cycle:02d} / {self.total_cycles:02d}"
-        else:
-            text = f"Ciclo: {self.current_cycle:02d}"
-            
-        bottom_rect = QRectF(0, rect.height() - 25, rect.width(), 25)
-        painter.drawText(bottom_rect, Qt.AlignmentFlag.AlignCenter, text)
-
-    def _ease_in_out(self, t):
-        if t < 0.5: return 2 * t * t
-        return -1 + (4 - 2 * t) * t
-
-    def _draw_flip_style(self, painter):
-        rect = self.rect()
-        center_x = rect.center().x()
-        center_y = rect.center().y()
-        if self.show_cycles:
-            center_y -= 15
-
-        has_hours = int(self.curr_h) > 0 or int(self.prev_h) > 0
-        
-        avail_height = rect.height() - (30 if self.show_cycles else 0)
-        
-        if has_hours:
-            card_width = min(self.width() * 0.28, 90)
-            gap = 8
-        else:
-            card_width = min(self.width() * 0.42, 140)
-            gap = 12
-            
-        card_height = min(avail_height * 0.75, 180)
-        radius = 10
-        
-        font = painter.font()
-        font.setFamily("Arial") 
-        font.setWeight(QFont.Weight.Bold)
-        
-        pixel_size = int(card_height * 0.55)
-
-        if has_hours:
-            pixel_size = min(pixel_size, int(card_width * 0.75))
-            
-        font.setPixelSize(pixel_size) 
-        painter.setFont(font)
-
-        if has_hours:
-            total_w = (3 * card_width) + (2 * gap)
-            start_x = center_x - (total_w / 2)
-            
-            rect_hour = QRectF(start_x, center_y - card_height/2, card_width, card_height)
-            rect_min = QRectF(start_x + card_width + gap, center_y - card_height/2, card_width, card_height)
-            rect_sec = QRectF(start_x + (card_width + gap)*2, center_y - card_height/2, card_width, card_height)
-        else:
-            rect_min = QRectF(center_x - card_width - gap/2, center_y - card_height/2, card_width, card_height)
-            rect_sec = QRectF(center_x + gap/2, center_y - card_height/2, card_width, card_height)
-
-        visual_progress = self._ease_in_out(self.anim_progress)
-
-        if has_hours:
-            if self.prev_h != self.curr_h and self.anim_progress < 1.0:
-                self._draw_animated_card(painter, rect_hour, self.prev_h, self.curr_h, visual_progress, radius)
-            else:
-                self._draw_static_card(painter, rect_hour, self.curr_h, radius)
-
-        if self.prev_m != self.curr_m and self.anim_progress < 1.0:
-            self._draw_animated_card(painter, rect_min, self.prev_m, self.curr_m, visual_progress, radius)
-        else:
-            self._draw_static_card(painter, rect_min, self.curr_m, radius)
-
-        if self.prev_s != self.curr_s and self.anim_progress < 1.0:
-            self._draw_animated_card(painter, rect_sec, self.prev_s, self.curr_s, visual_progress, radius)
-        else:
-            self._draw_static_card(painter, rect_sec, self.curr_s, radius)
-
-    def _draw_static_card(self, painter, r, text, radius):
-        self._draw_card_half(painter, r, text, radius, is_top=True)
-        self._draw_card_half(painter, r, text, radius, is_top=False)
-        self._draw_split_line(painter, r)
-
-    def _draw_animated_card(self, painter, r, old_text, new_text, progress, radius):
-        self._draw_card_half(painter, r, new_text, radius, is_top=True)
-        self._draw_card_half(painter, r, old_text, radius, is_top=False)
-
-        center_y = r.center().y()
-        
-        if progress < 0.5:
-            scale = 1.0 - (progress * 2)
-            painter.save()
-            painter.translate(r.center().x(), center_y)
-            painter.scale(1.0, scale)
-            painter.translate(-r.center().x(), -center_y)
-            self._draw_card_half(painter, r, old_text, radius, is_top=True)
-            self._draw_shadow(painter, r, alpha=int(progress * 220), is_top=True)
-            painter.restore()
-        else:
-            scale = (progress - 0.5) * 2
-            painter.save()
-            painter.translate(r.center().x(), center_y)
-            painter.scale(1.0, scale)
-            painter.translate(-r.center().x(), -center_y)
-            self._draw_card_half(painter, r, new_text, radius, is_top=False)
-            self._draw_shadow(painter, r, alpha=int((1.0 - progress) * 220), is_top=False)
-            painter.restore()
-
-        self._draw_split_line(painter, r)
-
-    def _draw_card_half(self, painter, r, text, radius, is_top):
-        painter.save()
-        center_y = r.center().y()
-        
-        margin = 2.0 
-        if is_top:
-            clip_rect = QRectF(r.left()-margin, r.top()-margin, r.width()+margin*2, (center_y - r.top()) + margin)
-        else:
-            clip_rect = QRectF(r.left()-margin, center_y, r.width()+margin*2, (r.bottom() - center_y) + margin)
-            
-        painter.setClipRect(clip_rect)
-
-        gradient = QLinearGradient(r.topLeft(), r.bottomLeft())
-        gradient.setColorAt(0.0, QColor(50, 50, 50))
-        gradient.setColorAt(0.48, QColor(30, 30, 30))
-        gradient.setColorAt(0.52, QColor(25, 25, 25))
-        gradient.setColorAt(1.0, QColor(45, 45, 45))
-
-        painter.setPen(QPen(QColor(10, 10, 10), 1.5))
-        painter.setBrush(gradient)
-        painter.drawRoundedRect(r, radius, radius)
-
-        if self.custom_text_color:
-            painter.setPen(self.custom_text_color)
-        else:
-            painter.setPen(QColor(245, 245, 245))
-        painter.drawText(r, Qt.AlignmentFlag.AlignCenter, text)
-        painter.restore()
-
-    def _draw_shadow(self, painter, r, alpha, is_top):
-        if alpha <= 0: return
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(0, 0, 0, min(alpha, 180)))
-        
-        center_y = r.center().y()
-        if is_top:
-            rect = QRectF(r.left(), r.top(), r.width(), r.height() / 2)
-        else:
-            rect = QRectF(r.left(), center_y, r.width(), r.height() / 2)
-        painter.drawRoundedRect(rect, 0, 0)
-
-    def _draw_split_line(self, painter, r):
-        center_y = r.center().y()
-        painter.setPen(QPen(QColor(5, 5, 5), 3))
-        p1 = QPointF(r.left()+1, center_y)
-        p2 = QPointF(r.right()-1, center_y)
-        painter.drawLine(p1, p2)
-        
-        hinge_w, hinge_h = 6, 10
-        hinge_color = QColor(20, 20, 20)
-        painter.setPen(QPen(QColor(5, 5, 5), 1))
-        painter.setBrush(hinge_color)
-        
-        h_left = QRectF(r.left() - 2, center_y - hinge_h/2, hinge_w, hinge_h)
-        h_right = QRectF(r.right() - hinge_w + 2, center_y - hinge_h/2, hinge_w, hinge_h)
-        
-        painter.drawRoundedRect(h_left, 2, 2)
-        painter.drawRoundedRect(h_right, 2, 2)
+ANNOTATE_DELAY_MS = 30000
 
 class StudyTimerDock(QDockWidget):
     def __init__(self, parent=None):
@@ -419,14 +44,25 @@ class StudyTimerDock(QDockWidget):
         self.main_layout.setContentsMargins(5, 5, 5, 5) 
         self.main_layout.setSpacing(5)
         
-        self.state = STOPPED
-        self.total_seconds = 0
-        self.elapsed_seconds = 0.0
-        self.last_tick = None
-        self.current_cycle = 1
+        self.engine = TimerEngine()
+        self.engine.subscribe(self._on_engine_event)
+        hooks.attach(self.engine)
+        self.sound_enabled = False
+
+        self._loading = False
+        self.config_store = ConfigStore(self._get_config_name(), self)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._tick)
+        self.scheduler = TickScheduler(self._tick, record_lateness=True)
+        metrics.register_source('scheduler', self.scheduler.stats)
+
+        self.annotate_timer = QTimer(self)
+        self.annotate_timer.setSingleShot(True)
+        self.annotate_timer.setInterval(ANNOTATE_DELAY_MS)
+        self.annotate_timer.timeout.connect(annotate_cycles)
+
+        self.snapshot_timer = QTimer(self)
+        self.snapshot_timer.setInterval(SNAPSHOT_INTERVAL_MS)
+        self.snapshot_timer.timeout.connect(self._save_snapshot)
 
         header_layout = QHBoxLayout()
         header_layout.setContentsMargins(0, 0, 0, 0)
@@ -437,7 +73,26 @@ class StudyTimerDock(QDockWidget):
         self.settings_btn.setFlat(True)
         self.settings_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.settings_btn.clicked.connect(self.toggle_settings)
-        
+
+        self.overlay_btn = QPushButton("⧉")
+        self.overlay_btn.setFixedSize(20, 20)
+        self.overlay_btn.setFlat(True)
+        self.overlay_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.overlay_btn.setToolTip("Mini timer flutuante")
+        self.overlay_btn.clicked.connect(self.toggle_overlay)
+
+        self.fullscreen_btn = QPushButton("⛶")
+        self.fullscreen_btn.setFixedSize(20, 20)
+        self.fullscreen_btn.setFlat(True)
+        self.fullscreen_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.fullscreen_btn.setToolTip("Tela cheia")
+        self.fullscreen_btn.clicked.connect(self.show_fullscreen)
+
+        self.overlay = None
+        self.fullscreen_view = None
+        
+        header_layout.addWidget(self.overlay_btn)
+        header_layout.addWidget(self.fullscreen_btn)
         header_layout.addWidget(self.settings_btn)
 
         self.settings_panel = QFrame()
@@ -448,7 +103,7 @@ class StudyTimerDock(QDockWidget):
         mode_layout = QHBoxLayout()
         self.lbl_op_mode = QLabel("Modo:")
         self.op_mode_combo = QComboBox()
-        self.op_mode_combo.addItems(["Temporizador", "Cronômetro"])
+        self.op_mode_combo.addItems(["Temporizador", "Cronômetro", "Pomodoro"])
         self.op_mode_combo.currentIndexChanged.connect(self.change_op_mode)
         mode_layout.addWidget(self.lbl_op_mode)
         mode_layout.addWidget(self.op_mode_combo)
@@ -457,6 +112,23 @@ class StudyTimerDock(QDockWidget):
         self.appearance_combo = QComboBox()
         self.appearance_combo.addItems(["Modo Circular", "Modo Foco", "Modo Flip", "Modo Linear"])
         
+        anim_layout = QHBoxLayout()
+        self.lbl_animation = QLabel("Animação:")
+        self.animation_combo = QComboBox()
+        self.animation_combo.addItems(["Suave", "Econômica", "Desligada"])
+        self.animation_combo.currentIndexChanged.connect(self.change_animation)
+        anim_layout.addWidget(self.lbl_animation)
+        anim_layout.addWidget(self.animation_combo)
+
+        quality_layout = QHBoxLayout()
+        self.adaptive_cb = QCheckBox("Qualidade adaptativa")
+        self.adaptive_cb.stateChanged.connect(self.toggle_adaptive_quality)
+        self.lbl_quality = QLabel()
+        quality_layout.addWidget(self.adaptive_cb)
+        quality_layout.addWidget(self.lbl_quality)
+        quality_governor().level_changed.connect(self._update_quality_label)
+        metrics.register_source('quality', quality_governor().stats)
+        
         loop_layout = QHBoxLayout()
         self.loop_cb = QCheckBox("Reiniciar auto")
         self.loop_cb.stateChanged.connect(self.toggle_loop_options)
@@ -471,8 +143,26 @@ class StudyTimerDock(QDockWidget):
         loop_layout.addWidget(self.loop_cb)
         loop_layout.addWidget(self.cycles_spin)
 
+        sound_layout = QHBoxLayout()
         self.sound_cb = QCheckBox("Alerta sonoro")
-        self.sound_cb.stateChanged.connect(self._save_config)
+        self.sound_cb.stateChanged.connect(self.toggle_sound)
+        self.btn_sound_file = QPushButton("Escolher som")
+        self.btn_sound_file.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_sound_file.clicked.connect(self.pick_sound_file)
+        sound_layout.addWidget(self.sound_cb)
+        sound_layout.addWidget(self.btn_sound_file)
+        self.sound_file = ""
+        self.sound_volume = DEFAULT_VOLUME
+        self.schedule = schedule_from_config(None)
+        self._sounded_phase = None
+
+        self.debug_cb = QCheckBox("Mostrar métricas")
+        self.debug_cb.stateChanged.connect(self.toggle_debug_overlay)
+
+        self.ipc_cb = QCheckBox("Publicar estado (socket local)")
+        self.ipc_cb.setToolTip(f"Envia o estado do timer em JSON por linha para o socket local \"{SERVER_NAME}\"")
+        self.ipc_cb.stateChanged.connect(self.toggle_ipc)
+        self.ipc_server = None
         
         colors_layout = QHBoxLayout()
         self.btn_text_color = QPushButton("Cor Texto")
@@ -493,12 +183,22 @@ class StudyTimerDock(QDockWidget):
         settings_layout.addLayout(mode_layout)
         settings_layout.addWidget(self.lbl_appearance)
         settings_layout.addWidget(self.appearance_combo)
+        settings_layout.addLayout(anim_layout)
+        settings_layout.addLayout(quality_layout)
         settings_layout.addLayout(colors_layout)
         settings_layout.addWidget(self.btn_reset_colors)
         settings_layout.addLayout(loop_layout)
-        settings_layout.addWidget(self.sound_cb)
+        settings_layout.addLayout(sound_layout)
+        settings_layout.addWidget(self.debug_cb)
+        settings_layout.addWidget(self.ipc_cb)
+
+        self.render_model = TimerRenderModel(self)
+        self.timer_display = TimerDisplayWidget(self.render_model)
 
-        self.timer_display = TimerDisplayWidget()
+        self.debug_label = QLabel()
+        self.debug_label.setWordWrap(True)
+        self.debug_label.setVisible(False)
+        self.debug_label.setStyleSheet("font-size: 10px; color: gray;")
         
         input_layout = QHBoxLayout()
         self.hour_input = QSpinBox()
@@ -529,18 +229,31 @@ class StudyTimerDock(QDockWidget):
         self.btn_stop.setFixedHeight(30)
         self.btn_stop.clicked.connect(self.stop)
 
+        self.btn_skip = QPushButton("PULAR FASE")
+        self.btn_skip.setFlat(True)
+        self.btn_skip.setFixedHeight(30)
+        self.btn_skip.clicked.connect(self.skip_phase)
+        self.btn_skip.setVisible(False)
+
+        self.named_timers = NamedTimersPanel()
+        self.named_timers.changed.connect(self._save_config)
+
         self.main_layout.addLayout(header_layout)
         self.main_layout.addWidget(self.settings_panel)
         self.main_layout.addWidget(self.timer_display)
+        self.main_layout.addWidget(self.debug_label)
         self.main_layout.addLayout(input_layout)
         self.main_layout.addWidget(self.btn_start)
         self.main_layout.addWidget(self.btn_stop)
+        self.main_layout.addWidget(self.btn_skip)
+        self.main_layout.addWidget(self.named_timers)
         self.main_layout.addStretch()
 
         self.setWidget(self.container)
 
         self.update_theme_styles()
         gui_hooks.theme_did_change.append(self.update_theme_styles)
+        gui_hooks.profile_will_close.append(self._flush_config)
         
         self._load_config()
 
@@ -548,27 +261,49 @@ class StudyTimerDock(QDockWidget):
         self.hour_input.valueChanged.connect(self._save_config)
         self.min_input.valueChanged.connect(self._save_config)
         self.sec_input.valueChanged.connect(self._save_config)
-        self.visibilityChanged.connect(self._save_config)
+        self.visibilityChanged.connect(self._on_visibility_changed)
 
     def _get_config_name(self):
         return __name__.split('.')[0]
 
     def _load_config(self):
         self.blockSignals(True)
+        self._loading = True
         
-        config = mw.addonManager.getConfig(self._get_config_name())
-        if not config: config = {}
+        config = self.config_store.snapshot()
 
         self.op_mode_combo.setCurrentIndex(config.get('op_mode', OP_MODE_TIMER))
         self.appearance_combo.setCurrentIndex(config.get('appearance', 0))
         self.loop_cb.setChecked(config.get('loop', False))
         self.cycles_spin.setValue(config.get('cycles', 0))
         self.sound_cb.setChecked(config.get('sound', False))
+        self.sound_enabled = self.sound_cb.isChecked()
+        self.named_timers.sound_enabled = self.sound_enabled
+        self.sound_file = config.get('sound_file') or ""
+        self.sound_volume = config.get('sound_volume', DEFAULT_VOLUME)
+        alert_sound().load(self.sound_file, self.sound_volume)
+        self.schedule = schedule_from_config(config.get('schedule'))
+        for phase in self.schedule.phases:
+            alert_sound().preload(phase.sound)
+        self.debug_cb.setChecked(config.get('debug_overlay', False))
+        self.ipc_cb.setChecked(config.get('ipc_enabled', False))
+        self._update_ipc()
+        self.adaptive_cb.setChecked(config.get('adaptive_quality', True))
+        quality_governor().set_enabled(self.adaptive_cb.isChecked())
+        self._update_quality_label()
+
+        duration = config.get('animation_duration', ANIMATION_DURATION)
+        frame_cap = config.get('animation_fps', FRAME_CAP)
+        if frame_cap in FRAME_CAP_OPTIONS:
+            self.animation_combo.setCurrentIndex(FRAME_CAP_OPTIONS.index(frame_cap))
+        animation_clock().configure(duration, frame_cap)
         
         self.hour_input.setValue(config.get('hours', 0))
         self.min_input.setValue(config.get('minutes', 25))
         self.sec_input.setValue(config.get('seconds', 0))
         
+        self.named_timers.load_config(config.get('named_timers', []))
+
         col_text = config.get('custom_text_color')
         col_ring = config.get('custom_ring_color')
         q_text = QColor(col_text) if col_text else None
@@ -579,10 +314,11 @@ class StudyTimerDock(QDockWidget):
         self.update_inputs_state()
         self.toggle_loop_options(self.loop_cb.isChecked())
         
+        self._loading = False
         self.blockSignals(False)
 
     def _save_config(self):
-        if not self.isVisible(): pass
+        if self._loading: return
 
         text_hex = self.timer_display.custom_text_color.name() if self.timer_display.custom_text_color else None
         ring_hex = self.timer_display.custom_ring_color.name() if self.timer_display.custom_ring_color else None
@@ -593,14 +329,38 @@ class StudyTimerDock(QDockWidget):
             'loop': self.loop_cb.isChecked(),
             'cycles': self.cycles_spin.value(),
             'sound': self.sound_cb.isChecked(),
+            'sound_file': self.sound_file,
+            'sound_volume': self.sound_volume,
+            'debug_overlay': self.debug_cb.isChecked(),
+            'ipc_enabled': self.ipc_cb.isChecked(),
+            'adaptive_quality': self.adaptive_cb.isChecked(),
+            'animation_fps': animation_clock().frame_cap,
+            'animation_duration': animation_clock().duration_ms,
             'hours': self.hour_input.value(),
             'minutes': self.min_input.value(),
             'seconds': self.sec_input.value(),
             'dock_visible': self.isVisible(),
             'custom_text_color': text_hex,
-            'custom_ring_color': ring_hex
+            'custom_ring_color': ring_hex,
+            'named_timers': self.named_timers.to_config(),
         }
-        mw.addonManager.writeConfig(self._get_config_name(), config)
+        self.config_store.update(config)
+
+    def _flush_config(self):
+        self._save_config()
+        if self.engine.state != STOPPED:
+            self._save_snapshot()
+        self.config_store.flush(blocking=True)
+
+    def _on_visibility_changed(self, visible):
+        self._save_config()
+        if not visible:
+            self.config_store.flush()
+
+    def closeEvent(self, event):
+        self._save_config()
+        self.config_store.flush()
+        super().closeEvent(event)
 
     def toggle_loop_options(self, checked):
         self.cycles_spin.setEnabled(checked)
@@ -608,9 +368,18 @@ class StudyTimerDock(QDockWidget):
         self._save_config()
 
     def update_display_cycle_info(self):
-        show = self.loop_cb.isChecked() and self.op_mode_combo.currentIndex() == OP_MODE_TIMER
-        total = self.cycles_spin.value()
-        self.timer_display.set_cycle_info(show, self.current_cycle, total)
+        op_mode = self.op_mode_combo.currentIndex()
+        show = (self.loop_cb.isChecked() and op_mode == OP_MODE_TIMER) or op_mode == OP_MODE_SCHEDULE
+        total = self.cycles_spin.value() if self.loop_cb.isChecked() else 1
+        stopped = self.engine.state == STOPPED
+        current = 1 if stopped else self.engine.current_cycle
+        label = None
+        if op_mode == OP_MODE_SCHEDULE:
+            phase = None if stopped else self.engine.phase()
+            if phase is None and self.schedule:
+                phase = self.schedule.phases[0]
+            label = phase.name if phase is not None else None
+        self.timer_display.set_cycle_info(show, current, total, label)
 
     def change_op_mode(self, index):
         self.stop()
@@ -618,39 +387,46 @@ class StudyTimerDock(QDockWidget):
         self._save_config()
 
     def update_inputs_state(self):
-        is_timer = (self.op_mode_combo.currentIndex() == OP_MODE_TIMER)
+        op_mode = self.op_mode_combo.currentIndex()
+        is_timer = (op_mode == OP_MODE_TIMER)
         self.hour_input.setEnabled(is_timer)
         self.min_input.setEnabled(is_timer)
         self.sec_input.setEnabled(is_timer)
-        self.loop_cb.setEnabled(is_timer)
-        self.cycles_spin.setEnabled(is_timer and self.loop_cb.isChecked())
+        self.loop_cb.setEnabled(op_mode != OP_MODE_STOPWATCH)
+        self.cycles_spin.setEnabled(op_mode != OP_MODE_STOPWATCH and self.loop_cb.isChecked())
+        self.btn_skip.setVisible(op_mode == OP_MODE_SCHEDULE)
         
-        if not is_timer:
-            self.timer_display.update_time(0.0, 0.0)
-        else:
-            total = (self.hour_input.value() * 3600) + (self.min_input.value() * 60) + self.sec_input.value()
-            self.timer_display.update_time(0.0, total)
+        self.timer_display.update_time(0.0, self._idle_seconds())
         
         self.update_display_cycle_info()
 
     def pick_text_color(self):
         color = QColorDialog.getColor()
         if color.isValid():
-            self.timer_display.custom_text_color = color
-            self.timer_display.update()
+            self.timer_display.set_custom_colors(color, self.timer_display.custom_ring_color)
             self._save_config()
 
     def pick_ring_color(self):
         color = QColorDialog.getColor()
         if color.isValid():
-            self.timer_display.custom_ring_color = color
-            self.timer_display.update()
+            self.timer_display.set_custom_colors(self.timer_display.custom_text_color, color)
+            self._save_config()
+
+    def toggle_sound(self, checked):
+        self.sound_enabled = bool(checked)
+        self.named_timers.sound_enabled = self.sound_enabled
+        self._save_config()
+
+    def pick_sound_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Escolher som", "", "Áudio WAV (*.wav)")
+        if path:
+            self.sound_file = path
+            alert_sound().load(path, self.sound_volume)
+            alert_sound().play()
             self._save_config()
 
     def reset_colors(self):
-        self.timer_display.custom_text_color = None
-        self.timer_display.custom_ring_color = None
-        self.timer_display.update()
+        self.timer_display.set_custom_colors(None, None)
         self._save_config()
 
     def update_theme_styles(self):
@@ -664,7 +440,7 @@ class StudyTimerDock(QDockWidget):
         settings_color = "rgba(255, 255, 255, 0.4)" if is_night else "rgba(0, 0, 0, 0.4)"
         settings_hover = "rgba(255, 255, 255, 1.0)" if is_night else "rgba(0, 0, 0, 1.0)"
 
-        self.settings_btn.setStyleSheet(f"""
+        header_style = f"""
             QPushButton {{ 
                 color: {settings_color}; 
                 border: none; 
@@ -674,7 +450,10 @@ class StudyTimerDock(QDockWidget):
             QPushButton:hover {{ 
                 color: {settings_hover};
             }}
-        """)
+        """
+        self.settings_btn.setStyleSheet(header_style)
+        self.overlay_btn.setStyleSheet(header_style)
+        self.fullscreen_btn.setStyleSheet(header_style)
 
         self.settings_panel.setStyleSheet(f"""
             QFrame {{ 
@@ -709,94 +488,218 @@ class StudyTimerDock(QDockWidget):
             QPushButton:hover {{ background-color: {btn_hover}; }}
         """)
 
+        self.btn_sound_file.setStyleSheet(btn_style)
         self.btn_stop.setStyleSheet(f"color: {text_color}; opacity: 0.7;")
-        self.timer_display.update()
+        self.btn_skip.setStyleSheet(f"color: {text_color}; opacity: 0.7;")
+        self.timer_display.refresh_theme()
+
+    def toggle_adaptive_quality(self, checked):
+        quality_governor().set_enabled(bool(checked))
+        self._update_quality_label()
+        self._save_config()
+
+    def _update_quality_label(self, level=None):
+        self.lbl_quality.setText(quality_governor().name())
+
+    def toggle_debug_overlay(self, checked):
+        self.debug_label.setVisible(bool(checked))
+        self._refresh_debug_overlay()
+        self._save_config()
+
+    def toggle_ipc(self, checked):
+        self._update_ipc()
+        self._save_config()
+
+    def _update_ipc(self):
+        if self.ipc_cb.isChecked():
+            if self.ipc_server is None:
+                max_clients = self.config_store.get('ipc_max_clients', MAX_CLIENTS)
+                self.ipc_server = TimerBroadcastServer(self.engine, max_clients=max_clients, parent=self)
+                metrics.register_source('ipc', self.ipc_server.stats)
+            self.ipc_server.start()
+        elif self.ipc_server is not None:
+            self.ipc_server.stop()
+
+    def _refresh_debug_overlay(self):
+        if self.debug_label.isVisible():
+            self.debug_label.setText(metrics.summary_line())
+
+    def toggle_overlay(self):
+        if self.overlay is not None:
+            self.overlay.close()
+            return
+        self.overlay = MiniTimerOverlay(self.render_model, self.toggle_start, mw)
+        self.overlay.destroyed.connect(self._on_overlay_destroyed)
+        self.overlay.show()
+
+    def _on_overlay_destroyed(self):
+        self.overlay = None
+
+    def show_fullscreen(self):
+        if self.fullscreen_view is None:
+            self.fullscreen_view = FullscreenTimerView(self.render_model, self.toggle_start)
+            self.fullscreen_view.destroyed.connect(self._on_fullscreen_destroyed)
+        self.fullscreen_view.showFullScreen()
+        self.fullscreen_view.activateWindow()
+
+    def _on_fullscreen_destroyed(self):
+        self.fullscreen_view = None
 
     def toggle_settings(self):
         self.settings_panel.setVisible(not self.settings_panel.isVisible())
 
+    def change_animation(self, index):
+        animation_clock().configure(frame_cap=FRAME_CAP_OPTIONS[index])
+        self._save_config()
+
     def change_appearance(self, index):
         self.timer_display.set_display_mode(index)
         self._save_config()
 
-    def toggle_start(self):
-        if self.state == RUNNING:
-            self.state = PAUSED
-            self.btn_start.setText("RETOMAR")
-        else:
-            if self.state == STOPPED:
-                if self.current_cycle > self.cycles_spin.value() and self.cycles_spin.value() > 0:
-                    self.current_cycle = 1
-                
-                self.update_display_cycle_info()
+    def _configured_total(self):
+        op_mode = self.op_mode_combo.currentIndex()
+        if op_mode == OP_MODE_SCHEDULE:
+            return self.schedule.total_seconds
+        if op_mode != OP_MODE_TIMER:
+            return 0
+        return (self.hour_input.value() * 3600) + (self.min_input.value() * 60) + self.sec_input.value()
 
-                if self.op_mode_combo.currentIndex() == OP_MODE_TIMER:
-                    h = self.hour_input.value()
-                    m = self.min_input.value()
-                    s = self.sec_input.value()
-                    self.total_seconds = (h * 3600) + (m * 60) + s
-                    
-                    if self.total_seconds == 0: return
-                    self.elapsed_seconds = 0.0
-                    self.timer_display.update_time(0.0, self.total_seconds)
-                else:
-                    self.total_seconds = 0
-                    self.elapsed_seconds = 0.0
-                    self.timer_display.update_time(0.0, 0.0)
-            
-            self.state = RUNNING
-            self.last_tick = time.time()
-            self.timer.start(200)
-            self.btn_start.setText("PAUSAR")
+    def _idle_seconds(self):
+        if self.op_mode_combo.currentIndex() == OP_MODE_SCHEDULE:
+            return self.schedule.phases[0].seconds if self.schedule else 0
+        return self._configured_total()
+
+    def _active_schedule(self):
+        if self.op_mode_combo.currentIndex() == OP_MODE_SCHEDULE:
+            return self.schedule
+        return None
+
+    def toggle_start(self):
+        if self.engine.state == STOPPED:
+            total = self._configured_total()
+            if total == 0 and self.op_mode_combo.currentIndex() != OP_MODE_STOPWATCH: return
+            self.engine.configure(total, self.loop_cb.isChecked(), self.cycles_spin.value(), self._active_schedule())
+            self.scheduler.reset_stats()
+        self.engine.toggle()
+
+    def skip_phase(self):
+        self.engine.skip_phase()
+
+    def jump_to_phase(self, index):
+        self.engine.jump_to_phase(index)
+
+    def _apply_phase(self, phase):
+        if phase is None:
+            self.timer_display.set_phase_color(None)
+            self.timer_display.set_display_mode(self.appearance_combo.currentIndex())
+            return
+        self.timer_display.set_phase_color(QColor(phase.color) if phase.color else None)
+        appearance = phase.appearance if phase.appearance is not None else self.appearance_combo.currentIndex()
+        self.timer_display.set_display_mode(appearance)
+        self.update_display_cycle_info()
 
     def stop(self):
-        self.state = STOPPED
-        self.timer.stop()
-        self.elapsed_seconds = 0.0
+        self.engine.stop()
+        self._show_stopped()
+
+    def _show_stopped(self):
+        self.scheduler.cancel()
         self.btn_start.setText("INICIAR")
-        self.current_cycle = 1
+        self._sounded_phase = None
+        self._apply_phase(None)
         self.update_display_cycle_info()
-        
-        if self.op_mode_combo.currentIndex() == OP_MODE_TIMER:
-            h = self.hour_input.value()
-            m = self.min_input.value()
-            s = self.sec_input.value()
-            total = (h * 3600) + (m * 60) + s
-            self.timer_display.update_time(0.0, total)
+        self.timer_display.update_time(0.0, self._idle_seconds())
+
+    def _on_engine_event(self, kind, engine, elapsed_seconds):
+        if kind == EVENT_TICK or kind == EVENT_CYCLE:
+            if kind == EVENT_CYCLE:
+                self.update_display_cycle_info()
+                self._save_snapshot()
+            self.timer_display.update_time(engine.progress(), engine.display_seconds())
+            self._refresh_debug_overlay()
+            self._arm_next_tick()
+            return
+
+        if kind == EVENT_STOP:
+            self.snapshot_timer.stop()
+            clear_snapshot()
+            self._record_event(kind, elapsed_seconds)
+            self._show_stopped()
+            return
+
+        if kind == EVENT_PHASE:
+            if self._sounded_phase is not None and self.sound_enabled:
+                alert_sound().play(engine.schedule.phases[self._sounded_phase].sound)
+            self._sounded_phase = engine.phase_index
+            self._apply_phase(engine.phase())
+            self.timer_display.update_time(engine.progress(), engine.display_seconds())
+            self._save_snapshot()
+            return
+
+        if kind == EVENT_CYCLE_COMPLETE:
+            self.timer_display.update_time(1.0, 0)
+            phase = engine.phase()
+            if self.sound_enabled:
+                alert_sound().play(phase.sound if phase else None)
+            self._sounded_phase = None
+            self._record_event(kind, elapsed_seconds)
+            self.annotate_timer.start()
+            return
+
+        if kind == EVENT_PAUSE:
+            self.scheduler.cancel()
+            self.snapshot_timer.stop()
+            self.btn_start.setText("RETOMAR")
         else:
-            self.timer_display.update_time(0.0, 0.0)
-
-    def _tick(self):
-        if self.state != RUNNING: return
-        now = time.time()
-        delta = now - self.last_tick
-        self.elapsed_seconds += delta
-        self.last_tick = now
-        
+            if kind == EVENT_START:
+                self.update_display_cycle_info()
+                self.timer_display.update_time(0.0, engine.display_seconds())
+            self.btn_start.setText("PAUSAR")
+            self._arm_next_tick()
+            self.snapshot_timer.start()
+        self._save_snapshot()
+        self._record_event(kind, elapsed_seconds)
+
+    def _save_snapshot(self):
+        data = self.engine.snapshot()
+        data['op_mode'] = self.op_mode_combo.currentIndex()
+        save_snapshot(data)
+
+    def restore_snapshot(self, data):
+        self.stop()
+        self.op_mode_combo.setCurrentIndex(data.get('op_mode', OP_MODE_TIMER))
+        self.loop_cb.setChecked(data.get('loop', False))
+        self.cycles_spin.setValue(data.get('cycles', 0))
         if self.op_mode_combo.currentIndex() == OP_MODE_TIMER:
-            remaining = max(self.total_seconds - self.elapsed_seconds, 0)
-            if self.total_seconds > 0:
-                progress = min(self.elapsed_seconds / self.total_seconds, 1.0)
-            else:
-                progress = 0
-            self.timer_display.update_time(progress, math.ceil(remaining))
-            
-            if remaining <= 0:
-                if self.sound_cb.isChecked():
-                    QApplication.beep()
-                
-                if self.loop_cb.isChecked():
-                    target_cycles = self.cycles_spin.value()
-                    if target_cycles == 0 or self.current_cycle < target_cycles:
-                        self.elapsed_seconds = 0.0
-                        self.last_tick = time.time() 
-                        self.current_cycle += 1
-                        self.update_display_cycle_info()
-                    else:
-                        self.stop()
-                else:
-                    self.stop()
-        else:
-            current_secs = self.elapsed_seconds
-            progress = 1.0 
-            self.timer_display.update_time(progress, math.floor(current_secs))
\ No newline at end of file
+            h, rest = divmod(data.get('total_seconds', 0), 3600)
+            m, sec = divmod(rest, 60)
+            self.hour_input.setValue(h)
+            self.min_input.setValue(m)
+            self.sec_input.setValue(sec)
+
+        self.engine.restore(data, self._active_schedule())
+        self._sounded_phase = self.engine.phase_index if self.engine.schedule is not None else None
+        self._apply_phase(self.engine.phase())
+        self.update_display_cycle_info()
+        self.timer_display.update_time(self.engine.progress(), self.engine.display_seconds())
+        self.btn_start.setText("RETOMAR")
+        if data.get('state') == RUNNING:
+            self.engine.start()
+
+    def _record_event(self, kind, elapsed_seconds):
+        engine = self.engine
+        session_store().record(
+            kind, self.op_mode_combo.currentIndex(), engine.current_cycle,
+            elapsed_seconds, engine.total_seconds, engine.cycle_started_ms, engine.focus_seconds,
+        )
+
+    def _arm_next_tick(self):
+        deadline_ns = self.engine.next_deadline_ns()
+        if deadline_ns is not None:
+            self.scheduler.arm_at(deadline_ns)
+
+    def tick_stats(self):
+        return self.scheduler.stats()
+
+    def _tick(self, now_ns):
+        self.engine.tick(now_ns)
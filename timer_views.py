@@ -0,0 +1,87 @@
+from aqt.qt import QWidget, QVBoxLayout, QLabel, QMenu, Qt
+from .display_widget import TimerDisplayWidget
+
+OVERLAY_WIDTH = 220
+OVERLAY_HEIGHT = 190
+
+FULLSCREEN_BASE_WIDTH = 360
+FULLSCREEN_BASE_HEIGHT = 300
+
+class MiniTimerOverlay(QWidget):
+    def __init__(self, model, on_toggle=None, parent=None):
+        super().__init__(
+            parent,
+            Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint,
+        )
+        self.setWindowTitle("Timer de Estudo")
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self._on_toggle = on_toggle
+        self._drag_offset = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        self.display = TimerDisplayWidget(model)
+        layout.addWidget(self.display)
+
+        self.setToolTip("Arraste para mover · Clique duplo para pausar/retomar")
+        self.resize(OVERLAY_WIDTH, OVERLAY_HEIGHT)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._drag_offset = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+
+    def mouseMoveEvent(self, event):
+        if self._drag_offset is not None:
+            self.move(event.globalPosition().toPoint() - self._drag_offset)
+
+    def mouseReleaseEvent(self, event):
+        self._drag_offset = None
+
+    def mouseDoubleClickEvent(self, event):
+        if self._on_toggle is not None:
+            self._on_toggle()
+
+    def contextMenuEvent(self, event):
+        menu = QMenu(self)
+        menu.addAction("Fechar", self.close)
+        menu.exec(event.globalPos())
+
+    def closeEvent(self, event):
+        self.display.model.detach(self.display)
+        super().closeEvent(event)
+
+class FullscreenTimerView(QWidget):
+    def __init__(self, model, on_toggle=None, parent=None):
+        super().__init__(parent, Qt.WindowType.Window)
+        self.setWindowTitle("Timer de Estudo")
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self._on_toggle = on_toggle
+
+        layout = QVBoxLayout(self)
+        self.display = TimerDisplayWidget(model)
+        layout.addWidget(self.display, 1)
+
+        hint = QLabel("Esc para sair · Espaço para pausar/retomar")
+        hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        hint.setStyleSheet("font-size: 11px; color: gray;")
+        layout.addWidget(hint)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        zoom = min(self.width() / FULLSCREEN_BASE_WIDTH, self.height() / FULLSCREEN_BASE_HEIGHT)
+        self.display.set_zoom(max(zoom, 1.0))
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key.Key_Escape:
+            self.close()
+        elif event.key() == Qt.Key.Key_Space and self._on_toggle is not None:
+            self._on_toggle()
+        else:
+            super().keyPressEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        self.close()
+
+    def closeEvent(self, event):
+        self.display.model.detach(self.display)
+        super().closeEvent(event)